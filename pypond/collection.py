@@ -10,6 +10,7 @@
 Implementation of Pond Collection class.
 """
 
+import bisect
 import copy
 import datetime
 import json
@@ -73,6 +74,10 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
         self._id = unique_id('collection-')
         self._event_list = None
         self._type = None
+        # lazily computed by _fingerprint()
+        self._fingerprint_cache = None
+        # lazily computed by _timestamps()
+        self._timestamp_cache = None
 
         if instance_or_list is None:
             self._event_list = pvector(list())
@@ -324,7 +329,6 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
             Raised if given a naive or non-UTC dtime
         """
 
-        i = copy.copy(b)  # paranoia
         size = self.size()
 
         if not size:
@@ -336,16 +340,28 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
             msg = 'at_time() and bisect() must be called with aware UTC datetime objects'
             raise CollectionException(msg)
 
-        while i < size:
-            ts_tmp = self.at(i).timestamp()
-            if ts_tmp > dtime:
-                return i - 1 if i - 1 >= 0 else 0
-            elif ts_tmp == dtime:
-                return i
+        timestamps = self._timestamps()
 
-            i += 1
+        if timestamps is None:
+            # not chronological - fall back to a linear scan.
+            i = b
+            while i < size:
+                ts_tmp = self._event_list[i].timestamp()
+                if ts_tmp > dtime:
+                    return i - 1 if i - 1 >= 0 else 0
+                elif ts_tmp == dtime:
+                    return i
 
-        return i - 1
+                i += 1
+
+            return i - 1
+
+        i = bisect.bisect_left(timestamps, dtime, b)
+
+        if i < size and timestamps[i] == dtime:
+            return i
+
+        return i - 1 if i - 1 >= 0 else 0
 
     def events(self):
         """
@@ -361,6 +377,18 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
         iterator
             An iterator to loop over the events.
         """
+        return self.iter_events()
+
+    def iter_events(self):
+        """
+        Iterator that walks the internal immutable event list directly
+        without building an intermediate list.
+
+        Returns
+        -------
+        iterator
+            An iterator over the events in the collection.
+        """
         return iter(self._event_list)
 
     def set_events(self, events):
@@ -423,11 +451,13 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
         """
         ret = dict()
 
-        for i in self.events():
+        for i in self._event_list:
             key = i.key()
-            if i.key() not in ret:
-                ret[key] = list()
-            ret[key].append(i)
+            bucket = ret.get(key)
+            if bucket is None:
+                ret[key] = [i]
+            else:
+                bucket.append(i)
 
         return ret
 
@@ -488,18 +518,31 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
         bool
             True if events are in chronologcal order.
         """
-        ret = True
-        current_ts = None
+        return self._timestamps() is not None
 
-        for i in self._event_list:
-            if current_ts is None:
-                current_ts = i.timestamp()
-            else:
-                if i.timestamp() < current_ts:
-                    ret = False
-                current_ts = i.timestamp()
+    def _timestamps(self):
+        """Lazily build the list of event timestamps used by bisect().
+        The event list is immutable so this is only done once per
+        collection.
 
-        return ret
+        Returns
+        -------
+        list
+            Event timestamps or None if the events are not in
+            chronological order.
+        """
+        if self._timestamp_cache is None:
+            timestamps = [i.timestamp() for i in self._event_list]
+
+            chrono = all(timestamps[i - 1] <= timestamps[i]
+                         for i in range(1, len(timestamps)))
+
+            self._timestamp_cache = timestamps if chrono else False
+
+        if self._timestamp_cache is False:
+            return None
+
+        return self._timestamp_cache
 
     # Series range
 
@@ -691,6 +734,26 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
 
         return Collection(collapsed_events)
 
+    def values(self, field_path=None):
+        """Pull the values of a single column out of the events in
+        one pass.
+
+        Parameters
+        ----------
+        field_path : str, list, tuple, None, optional
+            Name of a single value to look up. If None, defaults to ['value'].
+            "Deep" syntax either ['deep', 'value'], ('deep', 'value',)
+            or 'deep.value.'
+
+        Returns
+        -------
+        list
+            The values of the column in event order.
+        """
+        fpath = self._field_path_to_array(field_path)
+
+        return [i.get(fpath) for i in self._event_list]
+
     # sum/min/max etc
 
     def count(self):
@@ -1141,7 +1204,42 @@ class Collection(Bounded):  # pylint: disable=too-many-public-methods
             True if same values.
         """
         # pylint: disable=protected-access
-        return bool(
-            coll1._type == coll2._type and
-            coll1._event_list == coll2._event_list
-        )
+        if coll1._type != coll2._type:
+            return False
+
+        if coll1._event_list is coll2._event_list:
+            return True
+
+        if len(coll1._event_list) != len(coll2._event_list):
+            return False
+
+        # collections are immutable so the fingerprints are computed
+        # once and make repeated comparisons of unequal collections
+        # cheap. fall through to the full compare when they match
+        # (or can't be computed) to rule out collisions.
+        fp1 = coll1._fingerprint()
+        fp2 = coll2._fingerprint()
+
+        if fp1 is not None and fp2 is not None and fp1 != fp2:
+            return False
+
+        return bool(coll1._event_list == coll2._event_list)
+
+    def _fingerprint(self):
+        """
+        Hash of the event payloads, computed on first use and cached
+        since the event list can not change.
+
+        Returns
+        -------
+        int or None
+            Hash of the events or None if a payload is not hashable.
+        """
+        if self._fingerprint_cache is None:
+            try:
+                # pylint: disable=protected-access
+                self._fingerprint_cache = hash(tuple(hash(i._d) for i in self._event_list))
+            except TypeError:
+                self._fingerprint_cache = False
+
+        return self._fingerprint_cache if self._fingerprint_cache is not False else None
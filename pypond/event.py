@@ -16,7 +16,6 @@ http://software.es.net/pond/#/events
 # pylint: disable=too-many-lines
 
 import collections
-import copy
 import datetime
 import json
 
@@ -24,6 +23,12 @@ from functools import reduce  # pylint: disable=redefined-builtin
 
 import six
 
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    # python 2
+    from collections import Mapping
+
 from pyrsistent import thaw, freeze, PMap, pmap
 
 from .bases import PypondBase
@@ -143,6 +148,76 @@ class EventBase(PypondBase):
         """
         raise NotImplementedError  # pragma: nocover
 
+    def _point_head(self):
+        """abstract, override in subclasses. The leading time/index/timerange
+        element of to_point().
+
+        Raises
+        ------
+        NotImplementedError
+            Needs to be implemented in subclasses.
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def to_point_cols(self, cols):
+        """
+        Specialized to_point() for a fixed list of columns. When rendering
+        a whole series the columns are the same for every event so callers
+        can use this directly rather than having to_point() check the
+        arg on every event.
+
+        Parameters
+        ----------
+        cols : list
+            List of data columns to order the data points in.
+
+        Returns
+        -------
+        list
+            Time/index/timerange followed by points.
+        """
+        data = self.data()
+        return [self._point_head()] + [thaw(data.get(x, None)) for x in cols]
+
+    def to_point_all(self):
+        """
+        Specialized to_point() for when no columns are given. The points
+        will be whatever order that dict.values() decides to return it in.
+
+        Returns
+        -------
+        list
+            Time/index/timerange followed by points.
+        """
+        return [self._point_head()] + [thaw(x) for x in self.data().values()]
+
+    @staticmethod
+    def bulk_to_points(events, cols=None):
+        """
+        Render a batch of events as points in one pass, the column
+        arg is only checked once for the whole batch rather than
+        once per event by to_point().
+
+        Parameters
+        ----------
+        events : iterable
+            Events to render.
+        cols : list, optional
+            List of data columns to order the data points in. If not
+            specified, all values are rendered as per to_point_all().
+
+        Returns
+        -------
+        list
+            List of points as per to_point().
+        """
+        if cols is None:
+            return [i.to_point_all() for i in events]
+
+        cols = list(cols)
+
+        return [i.to_point_cols(cols) for i in events]
+
     def to_string(self):
         """
         Retruns the Event as a string, useful for serialization.
@@ -343,7 +418,9 @@ class EventBase(PypondBase):
         if isinstance(arg, dict):
             return freeze(arg)
         elif is_pmap(arg):
-            return copy.copy(arg)
+            # already immutable - copy.copy() would rebuild the whole
+            # map via pickling for no benefit.
+            return arg
         elif isinstance(arg, int) or isinstance(arg, float) or isinstance(arg, str):
             return freeze({'value': arg})
         else:
@@ -422,6 +499,27 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
     def _get_epoch_ms(self):
         return ms_from_dt(self.timestamp())
 
+    def _point_head(self):
+        return self._get_epoch_ms()
+
+    @staticmethod
+    def from_key(key, data):
+        """Inverse of key() - build a new Event from a key and data.
+
+        Parameters
+        ----------
+        key : int
+            ms since epoch as returned by key()
+        data : dict
+            Data payload for the new event.
+
+        Returns
+        -------
+        Event
+            A new event.
+        """
+        return Event(key, data)
+
     def to_json(self):
         """
         Returns the Event as a JSON object, essentially
@@ -462,16 +560,10 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
         list
             Epoch ms followed by points.
         """
-        points = [self._get_epoch_ms()]
-
-        data = thaw(self.data())
-
         if isinstance(cols, list):
-            points += [data.get(x, None) for x in cols]
-        else:
-            points += [x for x in list(data.values())]
+            return self.to_point_cols(cols)
 
-        return points
+        return self.to_point_all()
 
     def timestamp_as_utc_string(self):
         """The timestamp of this data, in UTC time, as a formatted string.
@@ -566,15 +658,14 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
         Event
             New event object.
         """
-        data = thaw(self.data()) if append else dict()
-        vals = list()
+        collapsed = reducer([self.get(i) for i in field_spec_list])
 
-        for i in field_spec_list:
-            vals.append(self.get(i))
+        if append:
+            # name is a top level column so just set it on the immutable
+            # payload rather than thawing and refreezing all of it.
+            return self.set_data(self.data().set(name, freeze(collapsed)))
 
-        data[name] = reducer(vals)
-
-        return self.set_data(data)
+        return self.set_data({name: collapsed})
 
     def key(self):
         """Return timestamp as ms since epoch
@@ -747,6 +838,48 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
 
     # merge methods (deal in lists of events)
 
+    @staticmethod
+    def _group_by_key(events):
+        """Group by the time (the key) in a single pass, as well as keeping
+        track of the event types so we can check that for a given key
+        they are homogeneous and also so we can build an output
+        event for this key.
+
+        Parameters
+        ----------
+        events : list
+            A list of a homogenous kind of event.
+
+        Returns
+        -------
+        tuple
+            (event_map, type_map) - the events and the event type
+            for each key.
+
+        Raises
+        ------
+        EventException
+            Raised if event list is not homogenous.
+        """
+        # ordered to retain ordering of events as passed in
+        event_map = collections.OrderedDict()
+        type_map = dict()
+
+        for event in events:
+            key = event.key()
+            bucket = event_map.get(key)
+
+            if bucket is None:
+                event_map[key] = [event]
+                type_map[key] = event.type()
+            else:
+                bucket.append(event)
+                if type_map[key] is not event.type():
+                    msg = 'Events for time {0} are not homogenous'.format(key)
+                    raise EventException(msg)
+
+        return event_map, type_map
+
     @staticmethod
     def merge(events):
         """Merges multiple `events` together into a new array of events, one
@@ -775,48 +908,17 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
         EventException
             Raised if event list is not homogenous.
         """
-        # need to defer import on these static methods to avoid
-        # circular import errors.
-        from .indexed_event import IndexedEvent
-        from .timerange_event import TimeRangeEvent
-
         if isinstance(events, list) or is_pvector(events):
             if len(events) == 0:
                 return list()
 
-        # ordered to retain ordering of events as passed in
-        event_map = collections.OrderedDict()
-        type_map = dict()
-
-        def group_by_time(event):
-            """Group by the time (the key), as well as keeping track
-            of the event types so we can check that for a given key
-            they are homogeneous and also so we can build an output
-            event for this key"""
-
-            typ = event.type()
-            key = event.key()
-
-            if key not in event_map:
-                event_map[key] = list()
-
-            event_map[key].append(event)
-
-            if key not in type_map:
-                type_map[key] = typ
-            else:
-                if type_map[key] != typ:
-                    msg = 'Events for time {0} are not homogenous'.format(key)
-                    raise EventException(msg)
-
-        for i in events:
-            group_by_time(i)
+        event_map, type_map = Event._group_by_key(events)
 
         def dict_merge(dct, merge_dct):
             """Merge two dicts, dct will be updated with values in merge_dct."""
             for k, _ in list(merge_dct.items()):
                 if (k in dct and isinstance(dct[k], dict) and
-                        isinstance(merge_dct[k], collections.Mapping)):
+                        isinstance(merge_dct[k], Mapping)):
                     dict_merge(dct[k], merge_dct[k])
                 else:
                     dct[k] = merge_dct[k]
@@ -829,16 +931,7 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
             for i in events:
                 dict_merge(data, thaw(i.data()))
 
-            typ = type_map.get(key)
-
-            if typ == Event:
-                out_events.append(Event(key, data))
-            elif typ == IndexedEvent:
-                out_events.append(IndexedEvent(key, data))
-            elif typ == TimeRangeEvent:
-                args = key.split(',')
-                trange = TimeRange(int(args[0]), int(args[1]))
-                out_events.append(TimeRangeEvent(trange, data))
+            out_events.append(type_map[key].from_key(key, data))
 
         return out_events
 
@@ -884,11 +977,6 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
             Raised if illegal input is received.
         """
 
-        # need to defer import on these static methods to avoid
-        # circular import errors.
-        from .indexed_event import IndexedEvent
-        from .timerange_event import TimeRangeEvent
-
         if isinstance(events, list) or is_pvector(events):
             if len(events) == 0:
                 return list()
@@ -900,33 +988,7 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
         elif isinstance(field_spec, (list, tuple)):
             field_names = field_spec
 
-        # ordered to retain ordering of events as passed in
-        event_map = collections.OrderedDict()
-        type_map = dict()
-
-        def group_by_time(event):
-            """Group by the time (the key), as well as keeping track
-            of the event types so we can check that for a given key
-            they are homogeneous and also so we can build an output
-            event for this key"""
-
-            typ = event.type()
-            key = event.key()
-
-            if key not in event_map:
-                event_map[key] = list()
-
-            event_map[key].append(event)
-
-            if key not in type_map:
-                type_map[key] = typ
-            else:
-                if type_map[key] != typ:
-                    msg = 'Events for time {0} are not homogenous'.format(key)
-                    raise EventException(msg)
-
-        for i in events:
-            group_by_time(i)
+        event_map, type_map = Event._group_by_key(events)
 
         out_events = list()
 
@@ -935,28 +997,22 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
 
             for event in events:
 
+                payload = event.data()
+
                 if field_names is None:
-                    field_names = list(thaw(event.data()).keys())
+                    field_names = list(payload.keys())
 
                 for field in field_names:
-                    if field not in map_event:
-                        map_event[field] = list()
-                    map_event[field].append(event.data().get(field))
+                    vals = map_event.get(field)
+                    if vals is None:
+                        vals = map_event[field] = list()
+                    vals.append(payload.get(field))
 
             data = dict()
             for field_name, values in list(map_event.items()):
                 data[field_name] = reducer(values)
 
-            typ = type_map[key]
-
-            if typ == Event:
-                out_events.append(Event(key, data))
-            elif typ == IndexedEvent:
-                out_events.append(IndexedEvent(key, data))
-            elif typ == TimeRangeEvent:
-                args = key.split(',')
-                trange = TimeRange(int(args[0]), int(args[1]))
-                out_events.append(TimeRangeEvent(trange, data))
+            out_events.append(type_map[key].from_key(key, data))
 
         return out_events
 
@@ -1070,31 +1126,30 @@ class Event(EventBase):  # pylint: disable=too-many-public-methods
         result = dict()
 
         def key_check(k):
-            """add needed keys to result"""
-            if k not in result:
-                result[k] = list()
+            """add needed keys to result and return the list of
+            values for that key."""
+            vals = result.get(k)
+            if vals is None:
+                vals = result[k] = list()
+            return vals
 
         if isinstance(field_spec, str):
             for evt in events:
-                key_check(field_spec)
-                result[field_spec].append(evt.get(field_spec))
+                key_check(field_spec).append(evt.get(field_spec))
         elif isinstance(field_spec, (list, tuple)):
             for spec in field_spec:
                 for evt in events:
-                    key_check(spec)
-                    result[spec].append(evt.get(spec))
+                    key_check(spec).append(evt.get(spec))
         elif is_function(field_spec):
             for evt in events:
                 pairs = field_spec(evt)
                 for k, v in list(pairs.items()):
-                    key_check(k)
-                    result[k].append(v)
+                    key_check(k).append(v)
         else:
             # type not found or None or none - map everything
             for evt in events:
                 for k, v in list(evt.data().items()):
-                    key_check(k)
-                    result[k].append(v)
+                    key_check(k).append(v)
 
         return result
 
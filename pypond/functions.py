@@ -12,7 +12,7 @@ Functions to act as reducers/aggregators, etc.
 
 from functools import reduce
 from math import sqrt, floor
-from operator import truediv
+from operator import add, truediv
 
 from .exceptions import FilterException, FunctionException
 from .util import is_valid
@@ -75,6 +75,14 @@ class Filters(object):
             return events
 
 
+def _total(vals):
+    """Left to right sum of the values shared by the numeric reducers.
+    operator.add keeps the same semantics as chaining + (it will also
+    concatenate strings, etc) but without a python level call for
+    every value."""
+    return reduce(add, vals, 0)
+
+
 def f_check(flt):
     """Set the default filter for aggregation operations when no
     filter is specified. When one is, make sure that it is a
@@ -150,7 +158,7 @@ class Functions(object):
             if vals is None:
                 return None  # pragma: no cover
 
-            return reduce(lambda x, y: x + y, vals, 0)
+            return _total(vals)
 
         return inner
 
@@ -167,7 +175,7 @@ class Functions(object):
             if len(vals) == 0:
                 return 0
 
-            return float(Functions.sum()(vals)) / len(vals)
+            return float(_total(vals)) / len(vals)
 
         return inner
 
@@ -306,9 +314,12 @@ class Functions(object):
             if vals is None:
                 return None  # pragma: no cover
 
-            avg = Functions.avg()(vals)
+            if len(vals) == 0:
+                return 0
+
+            avg = float(_total(vals)) / len(vals)
             variance = [(e - avg)**2 for e in vals]
-            return sqrt(Functions.avg()(variance))
+            return sqrt(float(_total(variance)) / len(variance))
 
         return inner
 
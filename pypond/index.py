@@ -20,12 +20,12 @@ from .bases import PypondBase
 from .exceptions import IndexException, IndexWarning
 from .range import TimeRange
 from .util import (
+    _ms_from_dt_unchecked,
     aware_dt_from_args,
     dt_from_ms,
     localtime_from_ms,
     localtime_info_from_utc,
     monthdelta,
-    ms_from_dt,
     sanitize_dt,
 )
 
@@ -37,6 +37,11 @@ UNITS = dict(
     d=dict(label='days', length=86400),
 )
 
+# window_duration() results keyed by window string - the same few windows
+# get parsed for every event that is bucketed. Dumped if it fills up.
+WINDOW_CACHE_SIZE = 1024
+_WINDOW_CACHE = dict()
+
 
 class Index(PypondBase):
     """
@@ -369,6 +374,11 @@ class Index(PypondBase):
         int
             Duration of the index/range in ms.
         """
+        try:
+            return _WINDOW_CACHE[win]
+        except KeyError:
+            pass
+
         range_re = re.match('([0-9]+)([smhd])', win)
 
         if range_re:
@@ -377,10 +387,17 @@ class Index(PypondBase):
 
             unit = range_re.group(2)
 
-            return num * UNITS[unit].get('length') * 1000
+            duration = num * UNITS[unit].get('length') * 1000
 
         else:
-            return None
+            duration = None
+
+        if len(_WINDOW_CACHE) >= WINDOW_CACHE_SIZE:
+            _WINDOW_CACHE.clear()
+
+        _WINDOW_CACHE[win] = duration
+
+        return duration
 
     @staticmethod
     def window_position_from_date(win, dtime):
@@ -401,7 +418,8 @@ class Index(PypondBase):
             The suffix for the index string.
         """
         duration = Index.window_duration(win)
-        ddms = ms_from_dt(sanitize_dt(dtime))
+        # sanitize_dt() does the checking
+        ddms = _ms_from_dt_unchecked(sanitize_dt(dtime))
         return int(ddms / duration)
 
     @staticmethod
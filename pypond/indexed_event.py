@@ -93,6 +93,24 @@ class IndexedEvent(EventBase):
         """
         return self.index().to_string()
 
+    @staticmethod
+    def from_key(key, data):
+        """Inverse of key() - build a new IndexedEvent from a key and data.
+
+        Parameters
+        ----------
+        key : str
+            Index string as returned by key()
+        data : dict
+            Data payload for the new event.
+
+        Returns
+        -------
+        IndexedEvent
+            A new event.
+        """
+        return IndexedEvent(key, data)
+
     def type(self):  # pylint: disable=no-self-use
         """Return the class of this event type.
 
@@ -122,16 +140,10 @@ class IndexedEvent(EventBase):
         list
             Epoch ms followed by points.
         """
-        points = [self.index_as_string()]
-
-        data = thaw(self.data())
-
         if isinstance(cols, list):
-            points += [data.get(x, None) for x in cols]
-        else:
-            points += [x for x in list(data.values())]
+            return self.to_point_cols(cols)
 
-        return points
+        return self.to_point_all()
 
     def index(self):
         """Returns the Index associated with the data in this Event.
@@ -215,6 +227,9 @@ class IndexedEvent(EventBase):
         """
         return self.index().as_string()
 
+    def _point_head(self):
+        return self.index_as_string()
+
     # data setters, returns new object
 
     def set_data(self, data):
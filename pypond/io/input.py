@@ -50,6 +50,11 @@ class PipelineIn(Observable):
             Raised if events are not all of one type.
         """
 
+        # fast path - events are nearly always of a single leaf type
+        # so an identity check on the class skips the isinstance() calls.
+        if type(event) is self._type:  # pylint: disable=unidiomatic-typecheck
+            return
+
         if self._type is None:
             if isinstance(event, Event):
                 self._type = Event
@@ -108,6 +113,28 @@ class Stream(PipelineIn):
         if self.has_observers() is True and self._running is True:
             self.emit(event)
 
+    def add_events(self, events):
+        """Type check and emit a batch of events.
+
+        All of the events are type checked before any of them are
+        emitted, so a heterogenous batch is rejected as a whole.
+
+        Parameters
+        ----------
+        events : list
+            A list of Event objects of the same class.
+        """
+        events = list(events)
+
+        check = self._check
+        for event in events:
+            check(event)
+
+        if self.has_observers() is True and self._running is True:
+            emit = self.emit
+            for event in events:
+                emit(event)
+
     def events(self):  # pylint: disable=no-self-use
         """Raise an exception - can't iterate an unbounded source."""
         msg = 'Iteration across unbounded sources is not suported.'
@@ -15,7 +15,7 @@ from ..exceptions import ProcessorException
 from ..indexed_event import IndexedEvent
 from ..io.output import Collector
 from ..timerange_event import TimeRangeEvent
-from ..util import is_pipeline, Options
+from ..util import is_function, is_pipeline, Options
 
 
 class Aggregator(Processor):
@@ -100,6 +100,13 @@ class Aggregator(Processor):
             msg = 'Unknown arg to Aggregator: {0}'.format(arg1)
             raise ProcessorException(msg)
 
+        # when emitting on each event, every maintained window is
+        # re-emitted for each incoming event even though only one
+        # of them changed. windows are immutable collections so the
+        # last aggregated event for each window can be re-used until
+        # its collection is replaced.
+        self._window_cache = dict() if self._emit_on == 'eachEvent' else None
+
         self._collector = Collector(
             Options(
                 window_type=self._window_type,
@@ -127,16 +134,23 @@ class Aggregator(Processor):
             (collection, window_key, group_by_key)
         )
 
-        new_d = dict()
+        cache_key = (window_key, group_by_key)
 
-        for field_name, field_map in list(self._fields.items()):
+        if self._window_cache is not None:
+            cached = self._window_cache.get(cache_key)
+            if cached is not None and cached[0] is collection:
+                self.emit(cached[1])
+                return
+
+        new_d = dict()
 
-            # field_list = [field_name] if isinstance(field_name, str) else list(field_name)
+        # pull each source column out of the window once so multiple
+        # aggregations on the same column (in_avg, in_max, etc) work
+        # on the same list of values rather than each re-walking
+        # the events.
+        columns = dict()
 
-            # self._log(
-            #     'Aggregator._collector_callback',
-            #     'field_name: {0}, map: {1}'.format(field_name, field_map)
-            # )
+        for field_name, field_map in list(self._fields.items()):
 
             if len(field_map) != 1:
                 msg = 'Fields should contain exactly one field'
@@ -145,7 +159,17 @@ class Aggregator(Processor):
             field = list(field_map.keys())[0]
             func = field_map[field]
 
-            new_d[field_name] = collection.aggregate(func, field)
+            if not is_function(func):
+                # let the collection raise the appropriate error
+                new_d[field_name] = collection.aggregate(func, field)
+                continue
+
+            col_key = tuple(self._field_path_to_array(field))
+
+            if col_key not in columns:
+                columns[col_key] = collection.values(col_key)
+
+            new_d[field_name] = func(columns[col_key])
 
         event = None
 
@@ -167,6 +191,9 @@ class Aggregator(Processor):
             'emitting: {0}', (event,)
         )
 
+        if self._window_cache is not None:
+            self._window_cache[cache_key] = (collection, event)
+
         self.emit(event)
 
     def clone(self):
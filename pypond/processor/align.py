@@ -16,13 +16,14 @@ import numbers
 from operator import truediv
 
 import six
+from six.moves import range, zip  # pylint: disable=redefined-builtin
+from pyrsistent import freeze
 
 from .base import Processor
 from ..event import Event
 from ..exceptions import ProcessorException, ProcessorWarning
 from ..index import Index
 from ..indexed_event import IndexedEvent
-from ..range import TimeRange
 from ..timerange_event import TimeRangeEvent
 from ..util import is_pipeline, Options, ms_from_dt, nested_set
 
@@ -58,6 +59,7 @@ class Align(Processor):
 
         # instance attrs
         self._previous = None
+        self._previous_pos = None
 
         if isinstance(arg1, Align):
             # Copy constructor
@@ -92,6 +94,18 @@ class Align(Processor):
             msg = 'limit arg must be None or an integer'
             raise ProcessorException(msg)
 
+        # resolved once rather than per event/boundary
+        self._window_ms = Index.window_duration(self._window)
+        self._field_paths = [self._field_path_to_array(i) for i in self._field_spec]
+
+        # the payload used when the limit is hit never changes
+        none_data = dict()
+
+        for field_path in self._field_paths:
+            nested_set(none_data, field_path, None)
+
+        self._none_payload = freeze(none_data)
+
     def clone(self):
         """Clone this Align processor.
 
@@ -102,106 +116,127 @@ class Align(Processor):
         """
         return Align(self)
 
-    def _get_interpolation_boundaries(self, event):
-        """
-        Return a list of indexes of window boundaries if the current event
-        and the previous event do not lie in the same window. If in the same,
-        return an empty list.
+    def _get_interpolation_boundaries(self, position):
         """
+        Return the window positions to interpolate on if the current
+        event and the previous event do not lie in the same window. If in
+        the same, the range is empty.
 
-        if Index.get_index_string(self._window, self._previous.timestamp()) != \
-                Index.get_index_string(self._window, event.timestamp()):
-            # generate a list of indexes to lay new points on. skip the first
-            # one because the previous point is in an "old" window, interpolate
-            # the point at the beginning of the rest of the ones in the list.
-            trange = TimeRange(self._previous.timestamp(), event.timestamp())
-            return Index.get_index_string_list(self._window, trange)[1:]
-        else:
-            return list()
+        The previous event is in an "old" window, so the boundaries start
+        at the beginning of the window after that one. The positions are
+        a lazy range so they are never materialized as a list.
+        """
+        return range(self._previous_pos + 1, position + 1)
 
-    def _get_boundary_ms(self, boundary_index):  # pylint: disable=no-self-use
+    def _get_boundary_ms(self, position):
         """
-        Return the index string as ms.
+        Return the beginning of the window at position as ms.
 
         We are dealing in UTC only with the Index because the events
         all have internal timestamps in UTC and that's what we're
         aligning. Let the user display in local time if that's
         what they want.
         """
-        idx = Index(boundary_index)
-        return ms_from_dt(idx.begin())
+        return position * self._window_ms
 
-    def _is_aligned(self, event):
+    def _is_aligned(self, event, position):
         """
         Test to see if an event is perfectly aligned. Used on first event.
         """
-        bound = Index.get_index_string(self._window, event.timestamp())
-        return bool(self._get_boundary_ms(bound) == ms_from_dt(event.timestamp()))
+        return bool(self._get_boundary_ms(position) == ms_from_dt(event.timestamp()))
 
-    def _interpolate_hold(self, boundary, set_none=False):
+    def _interpolate_hold(self, boundaries, set_none=False):
         """
-        Generate a new event on the requested boundary and carry over the
-        value from the previous event.
+        Generate new events on the requested boundaries and carry over the
+        value from the previous event. Yields the new events, one per
+        boundary, as each boundary is crossed.
 
         A variation just sets the values to None - this is used when the
-        limit is hit.
-        """
-        new_data = dict()
-
-        boundary_ts = self._get_boundary_ms(boundary)
+        limit is hit. That payload is built once in the constructor.
 
-        for i in self._field_spec:
+        The carried over payload is the same for every boundary, so it is
+        made immutable once and shared by all of the new events.
+        """
+        if not boundaries:
+            # same window, nothing to do
+            return
 
-            field_path = self._field_path_to_array(i)
+        if set_none is False:
+            new_data = dict()
 
-            if set_none is False:
+            for field_path in self._field_paths:
                 nested_set(new_data, field_path, self._previous.get(field_path))
-            else:
-                nested_set(new_data, field_path, None)
 
-        return Event(boundary_ts, new_data)
+            payload = freeze(new_data)
+        else:
+            payload = self._none_payload
+
+        for i in boundaries:
+            yield Event(self._get_boundary_ms(i), payload)
 
-    def _interpolate_linear(self, boundary, event):
+    def _interpolate_linear(self, boundaries, event):
         """
         Generate a linear differential between two counter values that lie
-        on either side of a window boundary.
+        on either side of a run of window boundaries. Yields the new
+        events, one per boundary, as each boundary is crossed.
+
+        The timestamps and values of the two events are the same for every
+        boundary in the run, so they are fetched and checked once up front
+        and only the per boundary ratio is computed in the loop.
         """
 
-        new_data = dict()
+        if not boundaries:
+            # same window, nothing to do
+            return
 
         previous_ts = ms_from_dt(self._previous.timestamp())
-        boundary_ts = self._get_boundary_ms(boundary)
         current_ts = ms_from_dt(event.timestamp())
 
-        # this ratio will be the same for all values being processed
-        boundary_frac = truediv((boundary_ts - previous_ts), (current_ts - previous_ts))
-
-        for i in self._field_spec:
+        # (path, previous value, delta) - delta is None for the
+        # non-numeric/bad path values that get set to None.
+        segments = list()
 
-            field_path = self._field_path_to_array(i)
+        for i, field_path in zip(self._field_spec, self._field_paths):
 
             # generate the delta between the values and
             # bulletproof against non-numeric/bad path
 
             previous_val = self._previous.get(field_path)
-            current_val = event.get(i)
+            current_val = event.get(field_path)
 
             if not isinstance(previous_val, numbers.Number) or \
                     not isinstance(current_val, numbers.Number):
+                # warn once for the run rather than once per boundary
                 msg = 'Path {0} contains non-numeric values or does not exist - '.format(i)
                 msg += 'field: {0} will be set to None'.format(i)
 
                 self._warn(msg, ProcessorWarning)
 
-                nested_set(new_data, field_path, None)
-                continue
+                segments.append((field_path, None, None))
+            else:
+                segments.append((field_path, previous_val, current_val - previous_val))
+
+        for boundary in boundaries:
+
+            new_data = dict()
+
+            boundary_ts = self._get_boundary_ms(boundary)
 
-            # just being clear with that irrelevant outer set of grouping parens
-            differential = previous_val + ((current_val - previous_val) * boundary_frac)
+            # this ratio will be the same for all values being processed
+            boundary_frac = truediv((boundary_ts - previous_ts), (current_ts - previous_ts))
 
-            nested_set(new_data, field_path, differential)
+            for field_path, previous_val, delta in segments:
 
-        return Event(boundary_ts, new_data)
+                if delta is None:
+                    nested_set(new_data, field_path, None)
+                    continue
+
+                # just being clear with that irrelevant outer set of grouping parens
+                differential = previous_val + (delta * boundary_frac)
+
+                nested_set(new_data, field_path, differential)
+
+            yield Event(boundary_ts, new_data)
 
     def add_event(self, event):
         """
@@ -221,33 +256,35 @@ class Align(Processor):
 
         if self.has_observers():
 
+            position = Index.window_position_from_date(self._window, event.timestamp())
+
             # first event handling
             if self._previous is None:
                 self._previous = event
+                self._previous_pos = position
                 # If perfectly aligned, emit or it will get lost.
-                if self._is_aligned(event):
+                if self._is_aligned(event, position):
                     self.emit(event)
                 return
 
-            boundaries = self._get_interpolation_boundaries(event)
+            boundaries = self._get_interpolation_boundaries(position)
             fill_count = len(boundaries)
 
-            for bound in boundaries:
-                # if the returned list is not empty, interpolate an event
-                # on each of the boundaries and emit them.
+            if self._limit is not None and fill_count > self._limit:
+                # check to see if we have hit the limit first, if so
+                # this span of boundaries with None in the field spec
+                ievents = self._interpolate_hold(boundaries, set_none=True)
+            elif self._method == 'linear':
+                # otherwise, interpolate new points
+                ievents = self._interpolate_linear(boundaries, event)
+            elif self._method == 'hold':
+                ievents = self._interpolate_hold(boundaries)
+
+            for bound, ievent in zip(boundaries, ievents):
+                # the interpolation is a generator, so each boundary event
+                # is computed and emitted in the same sweep without
+                # building an intermediate list of events.
                 self._log('Align.add_event', 'boundary: {0}', (bound,))
-
-                if self._limit is not None and fill_count > self._limit:
-                    # check to see if we have hit the limit first, if so
-                    # this span of boundaries with None in the field spec
-                    ievent = self._interpolate_hold(bound, set_none=True)
-                else:
-                    # otherwise, interpolate new points
-                    if self._method == 'linear':
-                        ievent = self._interpolate_linear(bound, event)
-                    elif self._method == 'hold':
-                        ievent = self._interpolate_hold(bound)
-
                 self._log('Align.add_event', 'emitting: {0}', (ievent,))
                 self.emit(ievent)
 
@@ -256,3 +293,4 @@ class Align(Processor):
             # 1) the events were in the same window and nothing was emitted; or
             # 2) any necessary events were emitted in the previous loop
             self._previous = event
+            self._previous_pos = position
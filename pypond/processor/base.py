@@ -16,15 +16,18 @@ from ..util import is_pipeline, unique_id
 
 def add_prev_to_chain(n, chain):  # pylint: disable=invalid-name
     """
-    Recursive function to add values to the chain.
+    Walk back up the processors from n adding them to the chain until
+    the pipeline is reached, then add the pipeline input.
     """
-    chain.append(n)
+    while True:
+        chain.append(n)
+        prev = n.prev()
 
-    if is_pipeline(n.prev()):
-        chain.append(n.prev().input())
-        return chain
-    else:
-        add_prev_to_chain(n.prev(), chain)
+        if is_pipeline(prev):
+            chain.append(prev.input())
+            return chain
+
+        n = prev
 
 
 class Processor(Observable):
@@ -56,12 +59,6 @@ class Processor(Observable):
 
     def chain(self):
         """Return the chain"""
-        chain = [self]
-
-        if is_pipeline(self.prev()):
-            chain.append(self.prev().input())
-            return chain
-        else:
-            return add_prev_to_chain(self.prev(), chain)
+        return add_prev_to_chain(self, list())
 
     # flush() is inherited from Observable
@@ -10,7 +10,7 @@
 A processor to fill missing and invalid values.
 """
 
-import copy
+import collections
 import numbers
 from operator import truediv
 
@@ -30,12 +30,62 @@ from ..util import (
 )
 
 
+class _PendingEvent(object):  # pylint: disable=too-few-public-methods
+    """
+    An event being held by a linear Filler along with its data
+    payload and the number of columns that are still waiting on a
+    valid value to fill it. The payload is only thawed into a
+    mutable dict when a value is actually filled.
+    """
+
+    __slots__ = ('event', 'data', 'waiting', 'dirty', '_ms')
+
+    def __init__(self, event):
+        self.event = event
+        self.data = event.data()
+        self.waiting = 0
+        self.dirty = False
+        self._ms = None
+
+    def ms(self):
+        """timestamp of the event in ms since the epoch."""
+        if self._ms is None:
+            self._ms = ms_from_dt(self.event.timestamp())
+        return self._ms
+
+    def set(self, field_path, value):
+        """set a filled value in the data payload."""
+        if not self.dirty:
+            self.data = thaw(self.data)
+            self.dirty = True
+        nested_set(self.data, field_path, value)
+
+    def to_event(self):
+        """the event to emit, rebuilt only if values were filled."""
+        return self.event.set_data(self.data) if self.dirty else self.event
+
+
+class _LinearColumn(object):  # pylint: disable=too-few-public-methods
+    """
+    Linear fill state for a single column - the last good event
+    and the run of events pending a fill since then.
+    """
+
+    __slots__ = ('path', 'last_good', 'run')
+
+    def __init__(self, path):
+        self.path = path
+        self.last_good = None
+        self.run = list()
+
+
 class Filler(Processor):  # pylint: disable=too-many-instance-attributes
     """
     A processor that fills missing/invalid values in the event
     with new values (zero, interpolated or padded).
 
-    When doing a linear fill, Filler instances should be chained.
+    When doing a linear fill on multiple columns, each column is
+    filled independently in a single pass over the events.
     See the Fill/sanitize doc (sanitize.md) for details.
 
     If no field_spec is supplied, the default field 'value' will be used.
@@ -66,10 +116,11 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
         self._previous_event = None
         # key count for zero and pad fill
         self._key_count = dict()
-        # special state for linear fill
-        self._last_good_linear = None
-        # cache of events pending linear fill
-        self._linear_fill_cache = list()
+        # special state for linear fill - events held pending
+        # linear fill and the fill state for each column.
+        self._linear_pending = collections.deque()
+        self._linear_paths = list()
+        self._linear_state = dict()
 
         if isinstance(arg1, Filler):
             # pylint: disable=protected-access
@@ -101,12 +152,12 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
         elif self._field_spec is None:
             self._field_spec = ['value']
 
-        # when using linear mode, only a single column will be processed
-        # per instance. more details in sanitize.md
-        if self._method == 'linear' and len(self._field_spec) != 1:
-            msg = 'linear fill takes a path to a single column\n'
-            msg += ' - see the sanitize documentation for usage details.'
-            raise ProcessorException(msg)
+        if self._method == 'linear':
+            for path in self._field_spec:
+                field_path = tuple(self._field_path_to_array(path))
+                if field_path not in self._linear_state:
+                    self._linear_paths.append(field_path)
+                    self._linear_state[field_path] = _LinearColumn(field_path)
 
     def clone(self):
         """clone it."""
@@ -116,16 +167,23 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
         """
         Process and fill the values at the paths as apropos when the
         fill method is either pad or zero.
+
+        The immutable data payload is only thawed once a value
+        needs to be filled. Returns the new mutable data payload, or
+        None if nothing was filled.
         """
+        new_data = None
+
         for path in self._field_spec:
 
             field_path = self._field_path_to_array(path)
+            key = tuple(field_path)
 
             # initialize a counter for this column
-            if tuple(field_path) not in self._key_count:
-                self._key_count[tuple(field_path)] = 0
+            if key not in self._key_count:
+                self._key_count[key] = 0
 
-            val = nested_get(data, field_path)
+            val = nested_get(data if new_data is None else new_data, field_path)
 
             # this is pointing at a path that does not exist
             if val == 'bad_path':
@@ -137,143 +195,123 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
 
                 # have we hit the limit?
                 if self._fill_limit is not None and \
-                        self._key_count[tuple(field_path)] >= self._fill_limit:
+                        self._key_count[key] >= self._fill_limit:
                     continue
 
+                fill_val = None
+
                 if self._method == 'zero':  # set to zero
-                    nested_set(data, field_path, 0)
-                    # note that this column has been zeroed
-                    self._key_count[tuple(field_path)] += 1
+                    fill_val = 0
 
                 elif self._method == 'pad':  # set to previous value
                     if self._previous_event is not None:
-                        if is_valid(self._previous_event.get(field_path)):
-                            nested_set(
-                                data, field_path,
-                                self._previous_event.get(field_path)
-                            )
-                            # note that this column has been padded
-                            # on success
-                            self._key_count[tuple(field_path)] += 1
+                        fill_val = self._previous_event.get(field_path)
+
+                if is_valid(fill_val):
+                    if new_data is None:
+                        new_data = thaw(data)
+                    nested_set(new_data, field_path, fill_val)
+                    # note that this column has been zeroed or padded
+                    # on success
+                    self._key_count[key] += 1
 
             else:
                 # it is a valid value, so reset the counter for
                 # this column
-                self._key_count[tuple(field_path)] = 0
+                self._key_count[key] = 0
 
-    def _is_valid_linear_event(self, event):
-        """
-        Check to see if an even has good values when doing
-        linear fill since we need to keep a completely intact
-        event for the values.
+        return new_data
 
-        While we are inspecting the data payload, make a note if
-        any of the paths are pointing at a list. Then it
-        will trigger that filling code later.
+    def _linear_fill(self, event):
+        """
+        This handles the linear filling of all of the columns in
+        a single pass over the events.
+
+        Each event is put on a pending list and is held until none of
+        the columns are waiting on a valid value to fill it.
+        Every column tracks its own last good event and the run of
+        events waiting to be filled since then, so the columns are
+        filled independently of one another.
+
+        If an event is valid for a column, it becomes the "last good"
+        event for that column and any events pending for that column
+        are interpolated.
+
+        If an event has an invalid value for a column that has seen a
+        good value, it is added to the run for that column. If the
+        fill_limit is reached, the run is released unfilled and the
+        column goes back to waiting for a valid value.
+
+        Returns a list of events that are ready to be emitted. That
+        list may be empty, or be of indeterminate length.
         """
 
-        valid = True
+        entry = _PendingEvent(event)
+        self._linear_pending.append(entry)
+
+        for field_path in self._linear_paths:
 
-        field_path = self._field_path_to_array(self._field_spec[0])
+            column = self._linear_state[field_path]
 
-        val = nested_get(thaw(event.data()), field_path)
+            val = nested_get(entry.data, field_path)
 
-        # this is pointing at a path that does not exist, issue a warning
-        # can call the event valid so it will be emitted. can't fill what
-        # isn't there.
-        if val == 'bad_path':
-            self._warn('path does not exist: {0}'.format(field_path), ProcessorWarning)
-            return valid
+            # this is pointing at a path that does not exist, issue a
+            # warning and call the event valid so it will be emitted.
+            # can't fill what isn't there.
+            if val == 'bad_path':
+                self._warn('path does not exist: {0}'.format(list(field_path)),
+                           ProcessorWarning)
+                self._close_run(column, entry, None)
+                continue
 
-        # a tracked field path is not valid so this is
-        # not a valid linear event. also, if it is not a numeric
-        # value, mark it as invalid and let _interpolate_event_list()
-        # complain about/skip it.
-        if not is_valid(val) or not isinstance(val, numbers.Number):
-            valid = False
+            # if it is not a numeric value, treat it as invalid and let
+            # _interpolate_run() complain about/skip it.
+            if is_valid(val) and isinstance(val, numbers.Number):
+                self._close_run(column, entry, val)
+            elif column.last_good is not None:
+                # an invalid value was received and we have previously
+                # seen a valid one, so add to the run for filling later.
+                column.run.append(entry)
+                entry.waiting += 1
+
+                # now make sure we have not exceeded the fill_limit
+                # if it has been set. if it has, release the run
+                # unfilled and reset the column such that invalid
+                # values pass through until another valid value is seen.
+                if self._fill_limit is not None and \
+                        len(column.run) >= self._fill_limit:
+                    for i in column.run:
+                        i.waiting -= 1
+                    column.run = list()
+                    column.last_good = None
+
+            # else an invalid value but we have not seen a good
+            # value yet so there is nothing to start filling "from"
+            # so just pass it through and live with it.
+
+        # hand back everything at the head of the pending list that
+        # is not waiting on any columns, retaining event order.
+        events = list()
 
-        return valid
+        while self._linear_pending and self._linear_pending[0].waiting == 0:
+            events.append(self._linear_pending.popleft().to_event())
 
-    def _linear_fill(self, event):
+        return events
+
+    def _close_run(self, column, entry, val):
         """
-        This handles the linear filling. It returns a list of
-        events to be emitted. That list may only contain a single
-        event.
-
-        If an event is valid - it has valid values for all of
-        the field paths - it is cached as "last good" and
-        returned to be emitted. The return value is a list
-        of one event.
-
-        If an event has invalid values, it is cached to be
-        processed later and an empty list is returned.
-
-        Additional invalid events will continue to be cached until
-        a new valid value is seen, then the cached events will
-        be filled and returned. That will be a list of indeterminate
-        length.
+        A valid value was seen for a column - fill any pending run
+        for that column, then make this event the last good one.
         """
+        if column.run:
+            self._interpolate_run(column, entry, val)
 
-        # see if the event is valid and also if it has any
-        # list values to be filled.
-        is_valid_event = self._is_valid_linear_event(event)
-
-        # Deal with the event as apropos depending on if it is
-        # valid or not and if we have nor have not seen a valid
-        # event yet.
-
-        events = list()
+            for i in column.run:
+                i.waiting -= 1
 
-        if is_valid_event and not self._linear_fill_cache:
-            # valid event, no cached events, use as last good
-            # and return the event. This is what we want to see.
-            self._last_good_linear = event
-            events.append(event)
-        elif not is_valid_event and self._last_good_linear is not None:
-            # an invalid event was received and we have previously
-            # seen a valid event, so add to the cache for fill processing
-            # later.
-            self._linear_fill_cache.append(event)
-
-            # now make sure we have not exceeded the fill_limit
-            # if it has been set. if it has, emit all the cached
-            # events and reset the main state such that the next
-            # condition will continue to trigger until we see another
-            # valid event.
-
-            if self._fill_limit is not None and \
-                    len(self._linear_fill_cache) >= self._fill_limit:
-
-                for i in self._linear_fill_cache:
-                    self.emit(i)
-
-                self._linear_fill_cache = list()
-                self._last_good_linear = None
-
-        elif not is_valid_event and self._last_good_linear is None:
-            # an invalid event but we have not seen a good
-            # event yet so there is nothing to start filling "from"
-            # so just return and live with it.
-            events.append(event)
-        elif is_valid_event and self._linear_fill_cache:
-            # a valid event was received, and there are cached events
-            # to be processed, so process and return the filled events
-            # to be emitted.
-
-            event_list = [self._last_good_linear] + self._linear_fill_cache + [event]
-
-            # the first event a.k.a. self._last_good_linear has
-            # already been emitted either as a "good"
-            # event or as the last event in the previous filling pass.
-            # that's why it's being shaved off here.
-            for i in self._interpolate_event_list(event_list)[1:]:
-                events.append(i)
-
-            # reset the cache, note as last good
-            self._linear_fill_cache = list()
-            self._last_good_linear = event
+            column.run = list()
 
-        return events
+        column.last_good = entry
 
     def add_event(self, event):
         """
@@ -288,14 +326,13 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
 
             to_emit = list()
 
-            new_data = thaw(event.data())
-
             if self._method in ('zero', 'pad'):
                 # zero and pad use much the same method in that
                 # they both will emit a single event every time
-                # add_event() is called.
-                self._pad_and_zero(new_data)
-                emit = event.set_data(new_data)
+                # add_event() is called. the event is only rebuilt
+                # if something was filled.
+                new_data = self._pad_and_zero(event.data())
+                emit = event if new_data is None else event.set_data(new_data)
                 to_emit.append(emit)
                 # remember previous event for padding
                 self._previous_event = emit
@@ -312,112 +349,55 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
                 self._log('Filler.add_event', 'emitting: {0}', (emitted_event,))
                 self.emit(emitted_event)
 
-    def _interpolate_event_list(self, events):  # pylint: disable=too-many-branches, too-many-locals
+    def _interpolate_run(self, column, next_entry, next_value):
         """
-        The fundamental linear interpolation workhorse code.  Process
-        a list of events and return a new list. Does a pass for
-        every field_spec.
+        The fundamental linear interpolation workhorse code. Fill the
+        values in the run of pending events for a single column
+        between the last good event and next_entry. The values are
+        set in place on the pending data payloads.
 
-        This is abstracted out like this because we probably want
-        to interpolate a list of events not tied to a Collection.
-        A Pipeline result list, etc etc.
-
-        Sorry pylint, sometime you need to write a complex method.
+        Each value is interpolated from the previous (possibly just
+        filled) value to the next valid value.
         """
-        base_events = copy.copy(events)
-        # new array of interpolated events for each field path
-        new_events = list()
-
-        field_path = self._field_path_to_array(self._field_spec[0])
-
-        # setup done, loop through the events.
-        for event_enum in enumerate(base_events):
-            # cant interpolate first or last event so just save it
-            # as-is and move on.
-            if event_enum[0] == 0 or event_enum[0] == len(base_events) - 1:
-                new_events.append(event_enum[1])
-                continue
+        field_path = column.path
 
-            # if a non-numeric value is encountered, stop processing
-            # this field spec and hand back the original unfilled events.
-            if is_valid(event_enum[1].get(field_path)) and \
-                    not isinstance(event_enum[1].get(field_path),
-                                   numbers.Number):
+        # if a non-numeric value is encountered, stop processing
+        # this field spec and leave the run unfilled.
+        for entry in column.run:
+            if is_valid(nested_get(entry.data, field_path)):
                 self._warn(
                     'linear requires numeric values - skipping this field_spec',
                     ProcessorWarning
                 )
-                return base_events
-
-            # found a bad value so start calculating.
-            if not is_valid(event_enum[1].get(field_path)):
-
-                previous_value = None
-                previous_ts = None
-                next_value = None
-                next_ts = None
-
-                # look to the previous event in the new_event list since
-                # that's where previously interpolated values will be.
-                # if found, get the timestamp as well.
-
-                previous_value = new_events[event_enum[0] - 1].get(field_path)
-
-                if previous_value:
-                    previous_ts = ms_from_dt(new_events[event_enum[0] - 1].timestamp())
-
-                # see about finding the next valid value and its timestamp
-                # in the original list.
-
-                next_idx = event_enum[0] + 1
-
-                while next_value is None and next_idx < len(base_events):
-
-                    val = base_events[next_idx].get(field_path)
-
-                    if is_valid(val):
-                        next_ts = ms_from_dt(base_events[next_idx].timestamp())
-                        next_value = val  # terminates the loop
+                return
 
-                    next_idx += 1
+        previous_value = nested_get(column.last_good.data, field_path)
 
-                # previous_value should only be none if there are a string
-                # of bad values at the beginning of the sequence.
-                # next_value will be none if that value no longer has
-                # valid values in the rest of the sequence.
+        # previous_value will be none if the last good event did not
+        # have the path. next_value will be none for the same reason.
+        if previous_value is None or previous_value == 'bad_path' or \
+                next_value is None:
+            return
 
-                if previous_value is not None and next_value is not None:
-                    # pry the data from current event
-                    new_data = thaw(event_enum[1].data())
-                    current_ts = ms_from_dt(event_enum[1].timestamp())
+        previous_ts = column.last_good.ms()
+        next_ts = next_entry.ms()
 
-                    if previous_ts == next_ts:
-                        # average the two values
-                        new_val = truediv((previous_value + next_value), 2)
-                    else:
-                        point_frac = truediv(
-                            (current_ts - previous_ts), (next_ts - previous_ts))
-                        new_val = previous_value + ((next_value - previous_value) * point_frac)
-                    # set that value to the field spec in new data
-                    nested_set(new_data, field_path, new_val)
-                    # call .set_data() to create a new event
-                    new_events.append(event_enum[1].set_data(new_data))
-                else:
-                    # couldn't calculate new value either way, just
-                    # keep the old event.
-                    new_events.append(event_enum[1])
+        for entry in column.run:
+            current_ts = entry.ms()
 
+            if previous_ts == next_ts:
+                # average the two values
+                new_val = truediv((previous_value + next_value), 2)
             else:
-                # theoretically never called because the incoming lists
-                # will be bookended by valid events now that we're only
-                # processing a single column per Filler instance.
-                # leaving here in case we start feeding this new data.
-                new_events.append(event_enum[1])  # pragma: no cover
+                point_frac = truediv(
+                    (current_ts - previous_ts), (next_ts - previous_ts))
+                new_val = previous_value + ((next_value - previous_value) * point_frac)
 
-        # save the current state before doing another pass
-        # on a different field_path
+            # set that value to the field spec in the pending data
+            entry.set(field_path, new_val)
 
-        return new_events
+            previous_value = new_val
+            previous_ts = current_ts
 
     def flush(self):
         """Don't delegate flush to superclass yet. Make sure
@@ -431,7 +411,7 @@ class Filler(Processor):  # pylint: disable=too-many-instance-attributes
             # are there any left-over events like if a path
             # just stops seeing any good events so they are
             # never filled and emitted.
-            for i in self._linear_fill_cache:
-                self.emit(i)
+            while self._linear_pending:
+                self.emit(self._linear_pending.popleft().to_event())
 
         super(Filler, self).flush()
@@ -12,7 +12,6 @@ emit them as a TimeRangeEvent. Can be used alone or chained
 with the Align processor for snmp rates, etc.
 """
 
-import copy
 import numbers
 from operator import truediv
 
@@ -54,6 +53,8 @@ class Rate(Processor):
 
         # instance attrs
         self._previous = None
+        self._previous_ts = None
+        self._previous_vals = None
 
         if isinstance(arg1, Rate):
             # Copy constructor
@@ -73,6 +74,13 @@ class Rate(Processor):
         elif self._field_spec is None:
             self._field_spec = ['value']
 
+        # resolved once rather than per event
+        self._field_paths = [self._field_path_to_array(i) for i in self._field_spec]
+        self._rate_paths = [i[:-1] + [i[-1] + '_rate'] for i in self._field_paths]
+
+        # counter resets (negative rates) get set to None
+        self._drop_negative = self._allow_negative is False
+
     def clone(self):
         """Clone this Rate processor.
 
@@ -83,27 +91,22 @@ class Rate(Processor):
         """
         return Rate(self)
 
-    def _get_rate(self, event):
+    def _get_rate(self, current_ts, current_vals):
         """
         Generate a new TimeRangeEvent containing the rate in seconds
-        from two events.
+        from two events. current_ts is the event timestamp in ms and
+        current_vals the event values in field spec order - the previous
+        ones are kept from the last call so each event is only read once.
         """
 
         new_data = dict()
 
-        previous_ts = ms_from_dt(self._previous.timestamp())
-        current_ts = ms_from_dt(event.timestamp())
+        previous_ts = self._previous_ts
 
         ts_delta = truediv(current_ts - previous_ts, 1000)  # do it in seconds
 
-        for i in self._field_spec:
-
-            field_path = self._field_path_to_array(i)
-            rate_path = copy.copy(field_path)
-            rate_path[-1] += '_rate'
-
-            previous_val = self._previous.get(field_path)
-            current_val = event.get(i)
+        for rate_path, previous_val, current_val in \
+                zip(self._rate_paths, self._previous_vals, current_vals):
 
             if not isinstance(previous_val, numbers.Number) or \
                     not isinstance(current_val, numbers.Number):
@@ -117,7 +120,7 @@ class Rate(Processor):
 
             rate = truediv((current_val - previous_val), ts_delta)
 
-            if self._allow_negative is False and rate < 0:
+            if self._drop_negative and rate < 0:
                 # don't allow negative differentials in certain cases
                 nested_set(new_data, rate_path, None)
             else:
@@ -143,15 +146,22 @@ class Rate(Processor):
 
         if self.has_observers():
 
+            current_ts = ms_from_dt(event.timestamp())
+            current_vals = [event.get(i) for i in self._field_paths]
+
             if self._previous is None:
                 # takes two to tango
                 self._previous = event
+                self._previous_ts = current_ts
+                self._previous_vals = current_vals
                 return
 
-            output_event = self._get_rate(event)
+            output_event = self._get_rate(current_ts, current_vals)
 
             self._log('Rate.add_event', 'emitting: {0}', (output_event,))
 
             self.emit(output_event)
 
             self._previous = event
+            self._previous_ts = current_ts
+            self._previous_vals = current_vals
@@ -19,6 +19,7 @@ from pyrsistent import pvector
 from .bases import PypondBase
 from .exceptions import TimeRangeException, NAIVE_MESSAGE
 from .util import (
+    _ms_from_dt_unchecked,
     aware_utcnow,
     dt_from_ms,
     dt_is_aware,
@@ -28,13 +29,13 @@ from .util import (
     humanize_duration,
     is_pvector,
     monthdelta,
-    ms_from_dt,
     sanitize_dt,
 )
 
 
 class TimeRangeBase(PypondBase):
     """Base for TimeRange"""
+    __slots__ = ()
 
     @staticmethod
     def awareness_check(dtime):
@@ -150,6 +151,8 @@ class TimeRange(TimeRangeBase):  # pylint: disable=too-many-public-methods
     TimeRangeException
         Raised to indicate errors with args.
     """
+    # one per TimeRangeEvent so keep them small.
+    __slots__ = ('_range', '_ms')
 
     def __init__(self, instance_or_begin, end=None):
         """
@@ -157,9 +160,13 @@ class TimeRange(TimeRangeBase):  # pylint: disable=too-many-public-methods
         """
         super(TimeRange, self).__init__()
 
+        # (begin, end) in epoch ms - see _ms_range()
+        self._ms = None
+
         if isinstance(instance_or_begin, TimeRange):
             # copy constructor
             self._range = instance_or_begin._range  # pylint: disable=protected-access
+            self._ms = instance_or_begin._ms  # pylint: disable=protected-access
         elif isinstance(instance_or_begin, list) \
                 or isinstance(instance_or_begin, tuple) \
                 or is_pvector(instance_or_begin):
@@ -170,6 +177,7 @@ class TimeRange(TimeRangeBase):  # pylint: disable=too-many-public-methods
             if isinstance(instance_or_begin, int) and \
                     isinstance(end, int):
                 self._range = pvector([dt_from_ms(instance_or_begin), dt_from_ms(end)])
+                self._ms = (instance_or_begin, end)
             elif isinstance(instance_or_begin, datetime.datetime) and \
                     isinstance(end, datetime.datetime):
                 self.awareness_check([instance_or_begin, end])
@@ -193,6 +201,21 @@ class TimeRange(TimeRangeBase):  # pylint: disable=too-many-public-methods
         """
         return self._range
 
+    def _ms_range(self):
+        """The begin and end as epoch ms. The range is immutable so this
+        is worked out once, or taken straight from the ms constructor args.
+
+        Returns
+        -------
+        tuple
+            Tuple of two timestamps.
+        """
+        if self._ms is None:
+            # the constructor has sanitized both ends to aware UTC.
+            self._ms = (_ms_from_dt_unchecked(self.begin()), _ms_from_dt_unchecked(self.end()))
+
+        return self._ms
+
     def to_json(self):
         """
         Returns the TimeRange as a python list of two ms timestamps.
@@ -202,7 +225,7 @@ class TimeRange(TimeRangeBase):  # pylint: disable=too-many-public-methods
         list
             List of two timestamps.
         """
-        return [ms_from_dt(self.begin()), ms_from_dt(self.end())]
+        return list(self._ms_range())
 
     def to_string(self):
         """Returns the TimeRange as a string, useful for serialization.
@@ -481,7 +504,8 @@ class TimeRange(TimeRangeBase):  # pylint: disable=too-many-public-methods
         int
             Duration in ms.
         """
-        return ms_from_dt(self.end()) - ms_from_dt(self.begin())
+        begin, end = self._ms_range()
+        return end - begin
 
     def humanize_duration(self):
         """Humanize the duration.
@@ -13,13 +13,14 @@ http://software.es.net/pond/#/timeseries
 """
 
 import copy
+import heapq
 import json
 
 from pyrsistent import pmap, thaw
 
 from .bases import PypondBase
 from .collection import Collection
-from .event import Event
+from .event import Event, EventBase
 from .exceptions import TimeSeriesException
 from .index import Index
 from .indexed_event import IndexedEvent
@@ -84,6 +85,8 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
     ----------
     event_type_map : dict
         Map text keys from wire format to the appropriate Event class.
+    type_column_map : dict
+        Inverse of event_type_map - Event class to wire format key.
     """
 
     event_type_map = dict(
@@ -92,6 +95,12 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
         index=IndexedEvent,
     )
 
+    type_column_map = {
+        Event: 'time',
+        TimeRangeEvent: 'timerange',
+        IndexedEvent: 'index',
+    }
+
     def __init__(self, instance_or_wire):
         """
         create a time series object
@@ -100,6 +109,9 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
 
         self._collection = None
         self._data = None
+        self._pipeline_cache = None
+        # windowed pipeline prefixes keyed by (interval, utc) - see _rollup()
+        self._rollup_cache = dict()
 
         if isinstance(instance_or_wire, TimeSeries):
             # copy ctor
@@ -134,17 +146,16 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
                 event_type = instance_or_wire.get('columns')[0]
                 event_fields = instance_or_wire.get('columns')[1:]
 
-                events = list()
+                try:
+                    event_cls = self.event_type_map[event_type]
+                except KeyError:
+                    msg = 'invalid event type {et}'.format(et=event_type)
+                    raise TimeSeriesException(msg)
 
-                for i in instance_or_wire.get('points'):
-                    time = i[0]
-                    event_values = i[1:]
-                    data = dict(list(zip(event_fields, event_values)))
-                    try:
-                        events.append(self.event_type_map[event_type](time, data))
-                    except KeyError:
-                        msg = 'invalid event type {et}'.format(et=event_type)
-                        raise TimeSeriesException(msg)
+                events = [
+                    event_cls(i[0], dict(zip(event_fields, i[1:])))
+                    for i in instance_or_wire.get('points')
+                ]
 
                 self._collection = Collection(events)
 
@@ -198,6 +209,13 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
 
         return pmap(ret)
 
+    def _type_column(self):
+        """Wire format header for the event type of the current collection.
+        Looked up from the collection rather than stored since
+        set_collection() can swap in events of a different type. Empty
+        collections have no type and get no header."""
+        return self.type_column_map.get(self._collection.type())
+
     def to_json(self):
         """
         Returns the TimeSeries as a python dict.
@@ -211,20 +229,13 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             Dictionary of columns and points
         """
 
-        columns = list()
-        points = list()
+        type_column = self._type_column()
 
-        if self._collection.type() == Event:
-            columns += ['time']
-        elif self._collection.type() == TimeRangeEvent:
-            columns += ['timerange']
-        elif self._collection.type() == IndexedEvent:
-            columns += ['index']
+        columns = [type_column] if type_column else list()
 
         columns += self.columns()
 
-        for i in self._collection.events():
-            points.append(i.to_point(columns[1:]))
+        points = EventBase.bulk_to_points(self._collection.iter_events(), columns[1:])
 
         cols_and_points = dict(
             columns=columns,
@@ -242,6 +253,95 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
 
         return cols_and_points
 
+    def to_columns(self):
+        """
+        Returns the TimeSeries as a column oriented python dict. This is
+        the wire format transposed - rather than a list of points, there is
+        a list of values for each column, keyed by the column name and
+        in event order. The first column is the time/timerange/index
+        column.
+
+        This is handy for handing a series off to column oriented
+        analytical code (numpy, pandas, etc) without going through
+        the events one at a time.
+
+        Returns
+        -------
+        dict
+            Dictionary of column names to lists of values.
+        """
+        columns = self.columns()
+
+        points = EventBase.bulk_to_points(self._collection.iter_events(), columns)
+
+        type_column = self._type_column()
+
+        names = ([type_column] if type_column else list()) + columns
+
+        if not points:
+            return dict((name, list()) for name in names)
+
+        return dict(
+            (name, list(vals)) for name, vals in zip(names, zip(*points))
+        )
+
+    @staticmethod
+    def from_columns(name, columns):
+        """
+        Inverse of to_columns() - build a TimeSeries from a column oriented
+        dict of equal length sequences. Exactly one of the keys has to be
+        a time/timerange/index column and the rest become the event data.
+
+        The columns can be any iterable sequences (lists, tuples,
+        array.array, etc) so column oriented data can be handed in
+        without first being transposed into wire format points.
+
+        Parameters
+        ----------
+        name : str
+            Name of the new series.
+        columns : dict
+            Dictionary of column names to sequences of values.
+
+        Returns
+        -------
+        TimeSeries
+            A new TimeSeries.
+
+        Raises
+        ------
+        TimeSeriesException
+            Raised if there is not a single time column or if the columns
+            are not the same length.
+        """
+        if not columns:
+            return TimeSeries(dict(name=name, events=list()))
+
+        type_keys = [i for i in columns if i in TimeSeries.event_type_map]
+
+        if len(type_keys) != 1:
+            msg = 'need exactly one time/timerange/index column - got {k}'.format(k=type_keys)
+            raise TimeSeriesException(msg)
+
+        event_cls = TimeSeries.event_type_map[type_keys[0]]
+        times = columns[type_keys[0]]
+
+        fields = [i for i in columns if i != type_keys[0]]
+        values = [columns[i] for i in fields]
+
+        if any(len(i) != len(times) for i in values):
+            msg = 'columns must all be the same length'
+            raise TimeSeriesException(msg)
+
+        rows = zip(*values) if fields else [()] * len(times)
+
+        events = [
+            event_cls(tval, dict(zip(fields, row)))
+            for tval, row in zip(times, rows)
+        ]
+
+        return TimeSeries(dict(name=name, events=events))
+
     def to_string(self):
         """
         Retruns the TimeSeries as a string, useful for serialization.
@@ -488,7 +588,7 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
         iterator
             Generator for loops.
         """
-        return iter(self._collection.event_list())
+        return self._collection.iter_events()
 
     # Access metadata about the series
 
@@ -568,11 +668,11 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
         """
         cret = dict()
 
-        for i in self._collection.events():
-            for v in list(i.to_json().values()):
-                if isinstance(v, dict):
-                    for key in list(v.keys()):
-                        cret[key] = True
+        # only the top level keys are needed so look at the immutable
+        # payloads rather than thawing each event via to_json().
+        for i in self._collection.iter_events():
+            for key in i.data().keys():
+                cret[key] = True
 
         return list(cret.keys())
 
@@ -660,6 +760,26 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
         """
         return self._collection.size_valid(field_path)
 
+    def values(self, field_path=None):
+        """
+        Pull the values of a single column out of the series in one
+        pass rather than going through at() for each event.
+
+        Parameters
+        ----------
+        field_path : str, list, tuple, None, optional
+            Name of value to look up. If None, defaults to ['value'].
+            "Deep" syntax either ['deep', 'value'], ('deep', 'value',)
+            or 'deep.value.'
+
+        Returns
+        -------
+        list
+            The values of the column in event order. This is a new list,
+            changing it does not change the series.
+        """
+        return self._collection.values(field_path)
+
     def count(self):
         """alias for size.
 
@@ -948,9 +1068,30 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
         Pipeline
             New pipline.
         """
-        # gotta avoid circular imports by deferring
-        from .pipeline import Pipeline
-        return Pipeline().from_source(self._collection)
+        # A source-only pipeline has no processors so appending to it
+        # never mutates it - build it once and hand out the same one.
+        if self._pipeline_cache is None:
+            # gotta avoid circular imports by deferring
+            from .pipeline import Pipeline
+            self._pipeline_cache = Pipeline().from_source(self._collection)
+
+        return self._pipeline_cache
+
+    def _run(self, pip):
+        """Run a pipeline built off of self.pipeline() and return a
+        new TimeSeries containing the resulting collection.
+
+        Parameters
+        ----------
+        pip : Pipeline
+            Pipeline with the processing chain to run.
+
+        Returns
+        -------
+        TimeSeries
+            A clone of this TimeSeries with the new Collection.
+        """
+        return self.set_collection(pip.to_keyed_collections().get('all'))
 
     def map(self, op):  # pylint: disable=invalid-name
         """Takes an operator that is used to remap events from this TimeSeries to
@@ -968,8 +1109,7 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             A clone of this TimeSeries with a new Collection generated by
             the map operation.
         """
-        coll = self.pipeline().map(op).to_keyed_collections()
-        return self.set_collection(coll.get('all'))
+        return self._run(self.pipeline().map(op))
 
     def select(self, field_spec=None):  # pylint: disable=invalid-name
         """call select on the pipeline.
@@ -989,8 +1129,7 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             A clone of this TimeSeries with a new Collection generated by
             the select operation.
         """
-        coll = self.pipeline().select(field_spec).to_keyed_collections()
-        return self.set_collection(coll.get('all'))
+        return self._run(self.pipeline().select(field_spec))
 
     def collapse(self, field_spec_list, name, reducer, append=True):
         """
@@ -1016,14 +1155,10 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             A new time series from the collapsed columns.
         """
 
-        coll = (
-            self.pipeline()
-            .collapse(field_spec_list, name, reducer, append)
-            .to_keyed_collections()
+        return self._run(
+            self.pipeline().collapse(field_spec_list, name, reducer, append)
         )
 
-        return self.set_collection(coll.get('all'))
-
     def rename_columns(self, rename_map):
         """TimeSeries.map() helper function to rename columns in the underlying
         events.
@@ -1051,37 +1186,22 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             the map operation.
         """
 
-        def rename(event):
-            """renaming mapper function."""
+        items = tuple(rename_map.items())
 
-            def renamed_dict(event):
-                """Handle renaming the columns in the data regardless
-                of event type."""
-
-                new_dict = thaw(event.data())
-
-                for old, new in list(rename_map.items()):
-                    new_dict[new] = new_dict.pop(old)
-
-                return new_dict
-
-            renamed_data = renamed_dict(event)
+        def rename(event):
+            """renaming mapper function. Only top level keys are
+            renamed so an evolver is used rather than thawing and
+            refreezing the whole data payload."""
 
-            # reassemble as per apropos for the event type
-            # with the newly renamed data payload
+            evolver = event.data().evolver()
 
-            if isinstance(event, Event):
-                return Event(event.timestamp(), renamed_data)
-            elif isinstance(event, TimeRangeEvent):
-                return TimeRangeEvent(
-                    (event.begin(), event.end()),
-                    renamed_data
-                )
-            elif isinstance(event, IndexedEvent):
-                return IndexedEvent(event.index(), renamed_data)
+            for old, new in items:
+                val = evolver[old]
+                del evolver[old]
+                evolver[new] = val
 
-            # an else isn't possible since Collection sanitizes
-            # the input.
+            # set_data() keeps the time/index/timerange as is
+            return event.set_data(evolver.persistent())
 
         return self.map(rename)
 
@@ -1114,53 +1234,64 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             the fill operation.
         """
 
-        pip = self.pipeline()
-
-        if method in ('zero', 'pad') or \
-                (method == 'linear' and not isinstance(field_spec, list)):
-            # either not linear or linear with a single path, or None.
-            # just install one Filler in the chain and go.
-            pip = pip.fill(field_spec, method, fill_limit)
-        elif method == 'linear' and isinstance(field_spec, list):
-            # linear w/multiple paths, chain multiple Fillers for
-            # asymmetric column filling.
-
-            for fpath in field_spec:
-                pip = pip.fill(fpath, method, fill_limit)
-        else:
+        if method not in ('zero', 'pad', 'linear'):
             msg = 'method {0} is not valid'.format(method)
             raise TimeSeriesException(msg)
 
-        coll = (
-            pip
-            .to_keyed_collections()
-        )
+        # a single Filler handles all of the paths - linear fill
+        # tracks the state for each column independently.
+        pip = self.pipeline().fill(field_spec, method, fill_limit)
 
-        return self.set_collection(coll.get('all'))
+        return self._run(pip)
 
-    def align(self, field_spec=None, window='5m', method='linear', limit=None):
+    def align(self, field_spec=None, window='5m', method='linear', limit=None,
+              skip_uniform=False):
         """
         Align entry point
+
+        If skip_uniform is True and method is linear, a series whose events
+        already sit exactly on every window boundary in order is returned
+        as is rather than being run through the Align processor. The
+        values are then the source values and not the interpolated ones,
+        which can differ in the last bit, and the columns outside of the
+        field_spec are kept, so this is off by default.
         """
-        coll = (
-            self.pipeline()
-            .align(field_spec, window, method, limit)
-            .to_keyed_collections()
-        )
+        if skip_uniform and method == 'linear' and self._is_uniform(window):
+            return self
+
+        return self._run(self.pipeline().align(field_spec, window, method, limit))
+
+    def _is_uniform(self, window):
+        """Check in one pass whether every event is on a window boundary
+        and each is exactly one window after the one before it."""
+        if self._collection.type() is not Event or self.size() == 0:
+            return False
+
+        window_ms = Index.window_duration(window)
+
+        if window_ms is None:
+            return False
+
+        previous = None
+
+        for event in self.events():
+            current = ms_from_dt(event.timestamp())
+
+            if previous is None:
+                if current % window_ms != 0:
+                    return False
+            elif current - previous != window_ms:
+                return False
+
+            previous = current
 
-        return self.set_collection(coll.get('all'))
+        return True
 
     def rate(self, field_spec=None, allow_negative=True):
         """
         derive entry point
         """
-        coll = (
-            self.pipeline()
-            .rate(field_spec, allow_negative)
-            .to_keyed_collections()
-        )
-
-        return self.set_collection(coll.get('all'))
+        return self._run(self.pipeline().rate(field_spec, allow_negative))
 
     def __str__(self):
         """call to_string()"""
@@ -1217,19 +1348,7 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             The resulting rolled up TimeSeries
         """
 
-        aggregator_pipeline = (
-            self.pipeline()
-            .window_by(window_size)
-            .emit_on('discard')
-            .aggregate(aggregation)
-        )
-
-        event_type_pipeline = aggregator_pipeline.as_events() if to_events \
-            else aggregator_pipeline
-
-        colls = event_type_pipeline.clear_window().to_keyed_collections()
-
-        return self.set_collection(colls.get('all'))
+        return self._rollup(window_size, aggregation, to_events)
 
     def hourly_rollup(self, aggregation, to_events=False):
         """
@@ -1441,20 +1560,41 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
         return self._rollup('yearly', aggregation, to_events, utc=utc)
 
     def _rollup(self, interval, aggregation, to_events=False, utc=True):
+        """Build and run the rollup pipeline shared by fixed_window_rollup()
+        and the calendar rollups in a single chain.
 
-        aggregator_pipeline = (
-            self.pipeline()
-            .window_by(interval, utc=utc)
-            .emit_on('discard')
-            .aggregate(aggregation)
-        )
+        Parameters
+        ----------
+        interval : str
+            Window size ('6h', '5m', etc) or calendar interval
+            ('daily', 'monthly', 'yearly').
+        aggregation : dict
+            The aggregation specification.
+        to_events : bool, optional
+            Convert to events
+        utc : bool, optional
+            Render the aggregations in UTC vs. local time.
+
+        Returns
+        -------
+        TimeSeries
+            The resulting rolled up TimeSeries
+        """
+        key = (interval, utc)
+        prefix = self._rollup_cache.get(key)
+
+        if prefix is None:
+            # the windowing only depends on the window spec so the
+            # prefix can be shared by every rollup on this series.
+            prefix = self.pipeline().window_by(interval, utc=utc).emit_on('discard')
+            self._rollup_cache[key] = prefix
 
-        event_type_pipeline = aggregator_pipeline.as_events() if to_events \
-            else aggregator_pipeline
+        pip = prefix.aggregate(aggregation)
 
-        colls = event_type_pipeline.clear_window().to_keyed_collections()
+        if to_events:
+            pip = pip.as_events()
 
-        return self.set_collection(colls.get('all'))
+        return self._run(pip.clear_window())
 
     def collect_by_fixed_window(self, window_size):
         """Summary
@@ -1518,6 +1658,9 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             Do the two have the same values?
         """
         # pylint: disable=protected-access
+        if series1 is series2:
+            return True
+
         return bool(
             series1._data == series2._data and
             Collection.same(series1._collection, series2._collection)
@@ -1560,11 +1703,28 @@ class TimeSeries(PypondBase):  # pylint: disable=too-many-public-methods
             msg = 'reducer function must be supplied, for example, avg()'
             raise TimeSeriesException(msg)
 
-        event_list = list()
-
-        for i in series_list:
-            for ii in i.events():
-                event_list.append(ii)
+        def decorate(sidx, series):
+            """Decorate the events so heapq.merge() can order them by
+            time, falling back to series and position order for
+            events with the same timestamp."""
+            if not series.size():
+                return
+
+            # collections are homogenous so the timestamp accessor
+            # only needs to be resolved once per series.
+            timestamp = type(series.at(0)).timestamp
+
+            for pos, event in enumerate(series.events()):
+                yield (timestamp(event), sidx, pos, event)
+
+        # each series is already chronological so merging them
+        # hands the events to the reducer in time order and the
+        # result does not need to be re-sorted.
+        event_list = [
+            i[3] for i in heapq.merge(
+                *[decorate(sidx, series) for sidx, series in enumerate(series_list)]
+            )
+        ]
 
         if field_spec is not None:
             events = reducer(event_list, field_spec)
@@ -11,10 +11,61 @@ TimeRangeEvent associates data with a specific time range rather than
 at a discret time like Event does.
 """
 
-from pyrsistent import pmap, thaw
+from pyrsistent import freeze, thaw
 
 from .event import EventBase
-from .util import is_pmap, ms_from_dt
+from .range import TimeRange
+from .util import is_pmap
+
+
+class _EventStorage(object):
+    """
+    Internal payload of a TimeRangeEvent. The payload only ever has the
+    two keys so a two slot record is used in place of a pmap - attribute
+    access is much cheaper than a pmap lookup. It supports the subset of
+    the pmap interface (get/set/equality/hashing) that the event code
+    uses on self._d.
+
+    Parameters
+    ----------
+    rng : TimeRange
+        The time range.
+    data : pyrsistent.pmap
+        The data payload.
+    """
+    __slots__ = ('range', 'data')
+
+    def __init__(self, rng, data):
+        self.range = rng
+        self.data = data
+
+    def get(self, key, default=None):
+        """pmap style lookup."""
+        if key == 'range':
+            return self.range
+        elif key == 'data':
+            return self.data
+
+        return default
+
+    def set(self, key, value):
+        """pmap style set, returns a new object."""
+        if key == 'range':
+            return _EventStorage(value, self.data)
+        elif key == 'data':
+            return _EventStorage(self.range, value)
+
+        raise KeyError(key)
+
+    def __eq__(self, other):
+        return bool(isinstance(other, _EventStorage) and
+                    self.range == other.range and self.data == other.data)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.range, self.data))
 
 
 class TimeRangeEvent(EventBase):
@@ -58,17 +109,40 @@ class TimeRangeEvent(EventBase):
         if isinstance(instance_or_args, TimeRangeEvent):
             super(TimeRangeEvent, self).__init__(instance_or_args._d)  # pylint: disable=protected-access
             return
-        elif is_pmap(instance_or_args):
+        elif isinstance(instance_or_args, _EventStorage):
             super(TimeRangeEvent, self).__init__(instance_or_args)
             return
+        elif is_pmap(instance_or_args):
+            super(TimeRangeEvent, self).__init__(
+                _EventStorage(instance_or_args.get('range'), instance_or_args.get('data')))
+            return
 
         rng = self.timerange_from_arg(instance_or_args)
         data = self.data_from_arg(arg2)
 
-        super(TimeRangeEvent, self).__init__(pmap(dict(range=rng, data=data)))
+        super(TimeRangeEvent, self).__init__(_EventStorage(rng, data))
 
         # Query/accessor methods
 
+    @classmethod
+    def _from_storage(cls, underscore_d):
+        """Build a new event directly from an internal payload, skipping the
+        arg dispatch in __init__.
+
+        Parameters
+        ----------
+        underscore_d : _EventStorage
+            Internal range/data payload for the new event.
+
+        Returns
+        -------
+        TimeRangeEvent
+            A new event.
+        """
+        obj = cls.__new__(cls)
+        EventBase.__init__(obj, underscore_d)
+        return obj
+
     def to_json(self):
         """
          Returns the TimeRangeEvent as a JSON object, essentially
@@ -86,10 +160,25 @@ class TimeRangeEvent(EventBase):
             Dict representation of internals (timerange, data).
         """
         return dict(
-            timerange=self.timerange().to_json(),
+            timerange=self._timerange_json(),
             data=thaw(self.data()),
         )
 
+    def _timerange_json(self):
+        """The timerange as a list of two ms timestamps. The TimeRange
+        caches the conversion so it is shared by every event with the
+        same range.
+
+        Returns
+        -------
+        list
+            List of two timestamps.
+        """
+        return self._d.range.to_json()
+
+    def _point_head(self):
+        return self._timerange_json()
+
     def key(self):
         """Returns a range string in the format 'begin,end' as expressed
         as ms since the epoch.
@@ -99,7 +188,26 @@ class TimeRangeEvent(EventBase):
         str
             The begin and end of the timerange in ms since the epoch.
         """
-        return '{0},{1}'.format(ms_from_dt(self.begin()), ms_from_dt(self.end()))
+        return '{0},{1}'.format(*self._timerange_json())
+
+    @staticmethod
+    def from_key(key, data):
+        """Inverse of key() - build a new TimeRangeEvent from a key and data.
+
+        Parameters
+        ----------
+        key : str
+            'begin,end' string as returned by key()
+        data : dict
+            Data payload for the new event.
+
+        Returns
+        -------
+        TimeRangeEvent
+            A new event.
+        """
+        args = key.split(',')
+        return TimeRangeEvent(TimeRange(int(args[0]), int(args[1])), data)
 
     def type(self):  # pylint: disable=no-self-use
         """Return the type of this event type
@@ -131,16 +239,10 @@ class TimeRangeEvent(EventBase):
         list
             Epoch ms followed by points.
         """
-        points = [self.timerange().to_json()]
-
-        data = thaw(self.data())
-
         if isinstance(cols, list):
-            points += [data.get(x, None) for x in cols]
-        else:
-            points += [x for x in list(data.values())]
+            return self.to_point_cols(cols)
 
-        return points
+        return self.to_point_all()
 
     def timerange_as_utc_string(self):
         """The timerange of this data, in UTC time, as a string.
@@ -181,7 +283,17 @@ class TimeRangeEvent(EventBase):
         TimeRange
             The underlying time range object.
         """
-        return self._d.get('range')
+        return self._d.range
+
+    def data(self):
+        """Direct access to the event data. The result will be an pyrsistent.pmap.
+
+        Returns
+        -------
+        pyrsistent.pmap
+            The immutable data payload.
+        """
+        return self._d.data
 
     def begin(self):
         """The begin time of this Event, which will be just the timestamp.
@@ -223,7 +335,30 @@ class TimeRangeEvent(EventBase):
             A new time range event object with new data payload.
         """
         _dnew = self._d.set('data', self.data_from_arg(data))
-        return TimeRangeEvent(_dnew)
+        return self._from_storage(_dnew)
+
+    def batch_set(self, mutations):
+        """Set several top level data columns at once and return a single
+        new TimeRangeEvent. The changes are made on one transient evolver
+        of the data payload rather than building an intermediate event
+        for each column with set_data().
+
+        Parameters
+        ----------
+        mutations : dict
+            Column names and their new values. Other columns are kept.
+
+        Returns
+        -------
+        TimeRangeEvent
+            A new time range event object with the updated payload.
+        """
+        evolver = self.data().evolver()
+
+        for key, val in mutations.items():
+            evolver[key] = freeze(val)
+
+        return self._from_storage(self._d.set('data', evolver.persistent()))
 
     # Humanize
 
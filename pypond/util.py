@@ -14,16 +14,25 @@ trying to traffic in aware datetime objects in UTC time.
 Additionally some boolean test functions and assorted other utility functions.
 """
 
+import calendar
 import datetime
+import functools
+import itertools
 import json
-import math
+import os
+import sys
 import time
 import types
 import warnings
 
 import humanize
 import pytz
-import tzlocal
+import six
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    ZoneInfo = None
 
 from pyrsistent import PMap, PVector
 
@@ -31,9 +40,126 @@ from pypond.exceptions import UtilityException, UtilityWarning
 
 # datetime conversion and utils
 
-EPOCH = datetime.datetime.utcfromtimestamp(0).replace(tzinfo=pytz.UTC)
-LOCAL_TZ = tzlocal.get_localzone()
+try:
+    # stdlib UTC is implemented in C - pytz.UTC is the python 2 fallback.
+    UTC = datetime.timezone.utc
+except AttributeError:  # pragma: no cover
+    UTC = pytz.UTC
+
+# still accepted from callers, bound here to skip the attribute
+# lookup in the per datetime checks.
+_PYTZ_UTC = pytz.UTC
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+
+
+# looking up the local zone reads the tz files off disk, so neither of
+# these is done until something actually needs local time.
+_TZLOCAL_TZ = None
+_LOCAL_TZ = None
+
+
+def _get_tzlocal_tz():
+    """The local timezone exactly as tzlocal hands it back, looked up on
+    first use. This is what the public LOCAL_TZ is, so callers can keep
+    using the pytz localize()/normalize() idiom on it.
+
+    Returns
+    -------
+    datetime.tzinfo
+        The local timezone.
+    """
+    global _TZLOCAL_TZ  # pylint: disable=global-statement
+
+    if _TZLOCAL_TZ is None:
+        import tzlocal
+        _TZLOCAL_TZ = tzlocal.get_localzone()
+
+    return _TZLOCAL_TZ
+
+
+def _local_zone():
+    """The local timezone used internally for conversions. Use the
+    zoneinfo zone of the same name as the tzlocal one when it is available
+    since that does the transition lookups in C. Falls back to the tzlocal
+    zone on python 2 or if the zone has no usable name.
+
+    Returns
+    -------
+    datetime.tzinfo
+        The local timezone.
+    """
+    local = _get_tzlocal_tz()
+
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(str(local))
+        except (KeyError, ValueError):
+            pass
+
+    return local
+
+
+def _get_local_tz():
+    """The internal local timezone, looked up on first use.
+
+    Returns
+    -------
+    datetime.tzinfo
+        The local timezone.
+    """
+    global _LOCAL_TZ  # pylint: disable=global-statement
+
+    if _LOCAL_TZ is None:
+        _LOCAL_TZ = _local_zone()
+
+    return _LOCAL_TZ
+
+
+def __getattr__(name):
+    """Resolve the public LOCAL_TZ lazily (python 3.7+)."""
+    if name == 'LOCAL_TZ':
+        return _get_tzlocal_tz()
+
+    raise AttributeError('module {m} has no attribute {n}'.format(m=__name__, n=name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # no module level __getattr__, resolve it up front.
+    LOCAL_TZ = _get_tzlocal_tz()
+
 HUMAN_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
+# HUMAN_FORMAT names, see _format_human()
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def _env_flag(name):
+    """True if the environment variable is set to 1, true or yes (any
+    case). Unset, empty, 0, false etc are all False."""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+# trust that datetimes were sanitized on the way in and skip the
+# per-call check in ms_from_dt(). Turned on by PYPOND_SKIP_DT_CHECKS=1
+# (or true/yes, any case) - any other value leaves the checks on.
+SKIP_DT_CHECKS = _env_flag('PYPOND_SKIP_DT_CHECKS')
+
+# dt_from_ms() results keyed by ms - the same window boundaries get
+# decoded over and over. Dumped wholesale when it fills up.
+DT_CACHE_SIZE = 4096
+_DT_CACHE = dict()
+
+# humanize_dt() output keyed by datetime - refreshed displays keep
+# rendering the same timestamps in local time.
+_HUMAN_CACHE = dict()
+
+# _to_local() results keyed by datetime.
+_LOCAL_CACHE = dict()
+
+# localtime_from_ms() whole second datetimes keyed by epoch seconds.
+_LOCAL_SEC_CACHE = dict()
 
 
 def dt_is_aware(dtime):
@@ -49,10 +175,16 @@ def dt_is_aware(dtime):
     bool
         Returns True if the dtime is aware/non-naive.
     """
-    if dtime.tzinfo is not None and dtime.tzinfo.utcoffset(dtime) is not None:
+    tzinfo = dtime.tzinfo
+
+    if tzinfo is None:
+        return False
+
+    # the zones we hand out always have an offset.
+    if tzinfo is UTC or tzinfo is _PYTZ_UTC or tzinfo is _LOCAL_TZ:
         return True
 
-    return False
+    return tzinfo.utcoffset(dtime) is not None
 
 
 def aware_utcnow():
@@ -63,7 +195,7 @@ def aware_utcnow():
     datetime.datetime
         New datetime object
     """
-    return to_milliseconds(datetime.datetime.utcnow().replace(tzinfo=pytz.UTC))
+    return to_milliseconds(datetime.datetime.utcnow().replace(tzinfo=UTC))
 
 
 def dt_from_ms(msec):
@@ -79,7 +211,42 @@ def dt_from_ms(msec):
     datetime.datetime
         New datetime object from ms
     """
-    return EPOCH + datetime.timedelta(milliseconds=msec)
+    try:
+        return _DT_CACHE[msec]
+    except KeyError:
+        pass
+
+    if len(_DT_CACHE) >= DT_CACHE_SIZE:
+        _DT_CACHE.clear()
+
+    dtime = _DT_CACHE[msec] = EPOCH + datetime.timedelta(milliseconds=msec)
+
+    return dtime
+
+
+dt_from_ms.cache_clear = _DT_CACHE.clear
+
+
+def bulk_dt_from_ms(msecs):
+    """generate datetime objects from a sequence of epoch milliseconds
+    in one pass. The input is numeric so there is nothing to check, and
+    the dt_from_ms() cache is bypassed since bulk timestamps are
+    mostly unique.
+
+    Parameters
+    ----------
+    msecs : iterable
+        epoch milliseconds
+
+    Returns
+    -------
+    list
+        New datetime objects from ms, in the same order.
+    """
+    epoch = EPOCH
+    delta = datetime.timedelta
+
+    return [epoch + delta(milliseconds=i) for i in msecs]
 
 
 def localtime_from_ms(msec):
@@ -95,7 +262,50 @@ def localtime_from_ms(msec):
     datetime.datetime
         New datetime object
     """
-    return datetime.datetime.fromtimestamp(msec / 1000.0, LOCAL_TZ)
+    if not isinstance(msec, six.integer_types):
+        return datetime.datetime.fromtimestamp(msec / 1000.0, _get_local_tz())
+
+    # zone offsets only change on whole seconds, so the zone lookup is
+    # done once per second and the ms are filled in after.
+    sec, rem = divmod(msec, 1000)
+
+    try:
+        local = _LOCAL_SEC_CACHE[sec]
+    except KeyError:
+        if len(_LOCAL_SEC_CACHE) >= DT_CACHE_SIZE:
+            _LOCAL_SEC_CACHE.clear()
+
+        local = _LOCAL_SEC_CACHE[sec] = datetime.datetime.fromtimestamp(sec, _get_local_tz())
+
+    return local.replace(microsecond=rem * 1000) if rem else local
+
+
+def _to_local(dtime):
+    """dtime.astimezone(LOCAL_TZ) - the zone transitions are looked
+    up on every conversion, so results are kept since the same timestamps
+    get rendered in local time repeatedly.
+
+    Parameters
+    ----------
+    dtime : datetime.datetime
+        An aware datetime object
+
+    Returns
+    -------
+    datetime.datetime
+        The same instant in the local time zone.
+    """
+    try:
+        return _LOCAL_CACHE[dtime]
+    except KeyError:
+        pass
+
+    if len(_LOCAL_CACHE) >= DT_CACHE_SIZE:
+        _LOCAL_CACHE.clear()
+
+    local = _LOCAL_CACHE[dtime] = dtime.astimezone(_get_local_tz())
+
+    return local
 
 
 def localtime_info_from_utc(dtime):
@@ -116,7 +326,7 @@ def localtime_info_from_utc(dtime):
     """
     _check_dt(dtime)
 
-    local = dtime.astimezone(LOCAL_TZ)
+    local = _to_local(dtime)
 
     local_info = dict(
         year=local.year,
@@ -155,9 +365,18 @@ def aware_dt_from_args(dtargs, localize=False):
         raise UtilityException('dtargs must be a dict')
 
     if localize:
-        return LOCAL_TZ.localize(datetime.datetime(**dtargs))
+        local_tz = _get_tzlocal_tz()
+
+        if not hasattr(local_tz, 'localize'):
+            # newer tzlocal hands back a zoneinfo zone - get the pytz one
+            # so ambiguous and skipped wall times resolve the same way.
+            local_tz = pytz.timezone(str(local_tz))
+
+        # pytz localize() takes standard time (is_dst=False) for wall
+        # times that are ambiguous or do not exist.
+        return local_tz.localize(datetime.datetime(**dtargs))
     else:
-        return datetime.datetime(**dtargs).replace(tzinfo=pytz.UTC)
+        return datetime.datetime(**dtargs).replace(tzinfo=UTC)
 
 
 # The awareness check on these functions is a dev bulletproofing maneuver.
@@ -169,12 +388,8 @@ def to_milliseconds(dtime):
     """Check to see if a datetime object has granularity smaller
     than millisecond (ie: microseconds) and massage back to ms if so.
 
-    Doing this round-trip seems kludgy and inefficient, but doing this:
-
-    return dtime.replace(millisecond=round(dt.millisecond, -3))
-
-    produced inconsistent results because of the rounding and I'm not
-    going to start treating numbers like strings.
+    Rounding the microseconds produced inconsistent results so the
+    sub-millisecond part is truncated instead, same as ms_from_dt().
 
     Parameters
     ----------
@@ -186,9 +401,10 @@ def to_milliseconds(dtime):
     datetime.datetime
         New datetime object rounded down to milliseconds from microseconds.
     """
-    if dtime.microsecond % 1000 != 0:
-        msec = ms_from_dt(dtime)
-        return dt_from_ms(msec)
+    rem = dtime.microsecond % 1000
+
+    if rem:
+        return dtime.replace(microsecond=dtime.microsecond - rem)
     else:
         return dtime
 
@@ -211,14 +427,20 @@ def _check_dt(dtime, utc_check=True):
     UtilityException
         Raised if dtime fails check.
     """
-    if not dt_is_aware(dtime):
+    tzinfo = dtime.tzinfo
+
+    # canonical UTC is aware and passes the utc check - the common case.
+    if tzinfo is UTC:
+        return
+
+    if tzinfo is None or tzinfo.utcoffset(dtime) is None:
         msg = 'Received a naive datetime object - check class input.'
         raise UtilityException(msg)
 
-    if utc_check:
-        if dtime.tzinfo is not pytz.UTC:
-            msg = 'Got non utc tz {t} - use pypond.util.sanitize_dt()'.format(t=dtime.tzinfo)
-            raise UtilityException(msg)
+    # pytz.UTC is still accepted from callers.
+    if utc_check and tzinfo is not _PYTZ_UTC:
+        msg = 'Got non utc tz {t} - use pypond.util.sanitize_dt()'.format(t=tzinfo)
+        raise UtilityException(msg)
 
 
 def ms_from_dt(dtime):
@@ -233,15 +455,66 @@ def ms_from_dt(dtime):
     -------
     int
         epoch milliseconds
+
+    Notes
+    -----
+    The aware/UTC check can be skipped by setting the PYPOND_SKIP_DT_CHECKS
+    environment variable to 1, true or yes. Only do that if every datetime entering pypond
+    has already been through sanitize_dt() or the event constructors.
     """
-    _check_dt(dtime)
+    if not SKIP_DT_CHECKS:
+        _check_dt(dtime)
+
+    return _ms_from_dt_unchecked(dtime)
+
+
+def _ms_from_dt_unchecked(dtime):
+    """ms_from_dt() without the _check_dt() call for callers that already
+    know dtime is aware UTC.
+
+    Parameters
+    ----------
+    dtime : datetime.datetime
+        An aware UTC datetime object
+
+    Returns
+    -------
+    int
+        epoch milliseconds
+    """
+    # stay in integer math rather than a total_seconds() float
+    # round trip.
+    diff = dtime - EPOCH
+
+    return diff.days * 86400000 + diff.seconds * 1000 + diff.microseconds // 1000
+
+
+def bulk_ms_from_dt(dtimes):
+    """Turn a sequence of datetime objects into ms since epoch in one
+    pass - the counterpart of bulk_dt_from_ms().
+
+    Parameters
+    ----------
+    dtimes : iterable
+        Aware UTC datetime objects
+
+    Returns
+    -------
+    list
+        epoch milliseconds, in the same order.
+    """
+    epoch = EPOCH
+    check = not SKIP_DT_CHECKS
+    ret = list()
+
+    for dtime in dtimes:
+        if check:
+            _check_dt(dtime)
 
-    # diff = dtime - EPOCH
-    # millis = diff.days * 24 * 60 * 60 * 1000
-    # millis += diff.seconds * 1000
-    # millis += diff.microseconds / 1000
+        diff = dtime - epoch
+        ret.append(diff.days * 86400000 + diff.seconds * 1000 + diff.microseconds // 1000)
 
-    return int((dtime - EPOCH).total_seconds() * 1000)
+    return ret
 
 
 def sanitize_dt(dtime, testing=False):
@@ -264,18 +537,30 @@ def sanitize_dt(dtime, testing=False):
     datetime.datetime
         New datetime object rounded to ms from microseconds.
     """
+    # fast path for the common case of an already sanitized datetime -
+    # a UTC tzinfo means it is aware so the check can be skipped.
+    if dtime.tzinfo is UTC and not dtime.microsecond % 1000:
+        return dtime
+
     _check_dt(dtime, utc_check=False)
 
-    if dtime.tzinfo is not pytz.UTC:
+    if dtime.tzinfo is _PYTZ_UTC:
+        # already UTC, just swap in the canonical tzinfo.
+        return to_milliseconds(dtime.replace(tzinfo=UTC))
+    elif dtime.tzinfo is not UTC:
         if not testing:
             msg = 'Got datetime with non utc tz {t}'.format(t=dtime.tzinfo)
-            msg += ' - coercing to UTC {dt}'.format(dt=dtime.astimezone(pytz.UTC))
+            msg += ' - coercing to UTC {dt}'.format(dt=dtime.astimezone(UTC))
             msg += ' - consider using datetime with UTC or ms since epoch instead'
             warnings.warn(msg, UtilityWarning, stacklevel=2)
-        return to_milliseconds(dtime.astimezone(pytz.UTC))
+        return to_milliseconds(dtime.astimezone(UTC))
     else:
-        # create new object just to do it.
-        return to_milliseconds(dtime + datetime.timedelta(seconds=0))
+        # datetime objects are immutable so there is no need to
+        # make a defensive copy.
+        return to_milliseconds(dtime)
+
+
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 def monthdelta(date, delta):
@@ -295,11 +580,15 @@ def monthdelta(date, delta):
     datetime.date
         New Date object with delta offset.
     """
-    month, year = (date.month + delta) % 12, date.year + ((date.month) + delta - 1) // 12
-    if not month:
-        month = 12
-    day = min(date.day, [31, 29 if year % 4 == 0 and not year % 400 == 0 else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1])  # pylint: disable=line-too-long
-    return date.replace(day=day, month=month, year=year)
+    month = (date.month + delta - 1) % 12 + 1
+    year = date.year + (date.month + delta - 1) // 12
+
+    if month == 2 and calendar.isleap(year):
+        days = 29
+    else:
+        days = DAYS_IN_MONTH[month - 1]
+
+    return date.replace(day=min(date.day, days), month=month, year=year)
 
 
 def format_dt(dtime, localize=False):
@@ -319,13 +608,37 @@ def format_dt(dtime, localize=False):
     """
     _check_dt(dtime)
 
-    # base_format = '%c %Z %z'
-    base_format = HUMAN_FORMAT
-
     if not localize:
-        return dtime.strftime(base_format)
+        return _format_human(dtime)
     else:
-        return dtime.astimezone(LOCAL_TZ).strftime(base_format)
+        return _format_human(_to_local(dtime))
+
+
+def _format_human(dtime):
+    """Render a datetime as per HUMAN_FORMAT. Same output as
+    dtime.strftime(HUMAN_FORMAT) in the C locale without strftime
+    re-parsing the format string on every call.
+
+    Parameters
+    ----------
+    dtime : datetime.datetime
+        A datetime object
+
+    Returns
+    -------
+    str
+        Formatted date string.
+    """
+    return '%s, %02d %s %d %02d:%02d:%02d %s' % (
+        _WEEKDAYS[dtime.weekday()],
+        dtime.day,
+        _MONTHS[dtime.month - 1],
+        dtime.year,
+        dtime.hour,
+        dtime.minute,
+        dtime.second,
+        dtime.tzname() or '',
+    )
 
 
 def humanize_dt(dtime):
@@ -341,7 +654,17 @@ def humanize_dt(dtime):
     str
         Datetime formatted as a string.
     """
-    return dtime.astimezone(LOCAL_TZ).strftime(HUMAN_FORMAT)
+    try:
+        return _HUMAN_CACHE[dtime]
+    except KeyError:
+        pass
+
+    if len(_HUMAN_CACHE) >= DT_CACHE_SIZE:
+        _HUMAN_CACHE.clear()
+
+    human = _HUMAN_CACHE[dtime] = _format_human(_to_local(dtime))
+
+    return human
 
 
 def humanize_dt_ago(dtime):
@@ -360,7 +683,7 @@ def humanize_dt_ago(dtime):
     # and here we went through all the trouble to make everything
     # UTC and offset-aware. Le sigh. The underlying lib uses datetime.now()
     # as the comparison reference, so we need naive localtime.
-    return humanize.naturaltime(dtime.astimezone(LOCAL_TZ).replace(tzinfo=None))
+    return humanize.naturaltime(_to_local(dtime).replace(tzinfo=None))
 
 
 def humanize_duration(delta):
@@ -381,6 +704,11 @@ def humanize_duration(delta):
 # various utility functions
 
 
+# seeded with the clock once at import and then just incremented, so
+# ids are unique within the process without a clock call per id.
+_UID_COUNTER = itertools.count(int(time.time() * 10000000))
+
+
 def unique_id(prefix=''):
     """generate a uuid with a prefix - for debugging. This probably isn't
     truly random but it's random enough. Calling uuid.uuid4() was imposing
@@ -397,7 +725,7 @@ def unique_id(prefix=''):
     str
         Prefixed uuid.
     """
-    return prefix + hex(int(time.time() * 10000000))[2:]
+    return prefix + '%x' % next(_UID_COUNTER)
 
 
 class ObjectEncoder(json.JSONEncoder):
@@ -411,8 +739,8 @@ class ObjectEncoder(json.JSONEncoder):
     """
 
     def default(self, obj):  # pylint: disable=method-hidden
-        if hasattr(obj, "to_json"):
-            return self.default(obj.to_json())
+        while hasattr(obj, "to_json"):
+            obj = obj.to_json()
 
         return obj
 
@@ -440,18 +768,18 @@ class Options(object):  # pylint: disable=too-few-public-methods
         Can supply keyword args for initial values.
     """
 
+    # the options live in a single dict slot, no per instance __dict__.
+    __slots__ = ('_data',)
+
     def __init__(self, **kwargs):
         """Encapsulation object for Pipeline options."""
-        self.__dict__['_data'] = {}
-
-        if kwargs:
-            self.__dict__['_data'] = kwargs
+        object.__setattr__(self, '_data', kwargs if kwargs else {})
 
     def __getattr__(self, name):
         return self._data.get(name, None)
 
     def __setattr__(self, name, value):
-        self.__dict__['_data'][name] = value
+        self._data[name] = value
 
     def __str__(self):
         return str(self.to_dict())
@@ -467,7 +795,7 @@ class Capsule(Options):  # pylint: disable=too-few-public-methods
     Object in cases where using a Python dict would cause confusion
     porting the code.
     """
-    pass
+    __slots__ = ()
 
 # functions to streamline dealing with nested dicts
 
@@ -532,18 +860,16 @@ def nested_get(dic, keys):
     obj
         Whatever value was at the terminus of the keys.
     """
-    for key in keys[:-1]:
-        if key in dic:
-            dic = dic.setdefault(key, {})
-        else:
-            # path branch does not exist, abort.
-            return 'bad_path'
-
+    # one lookup per level, no keys[:-1] slice or separate
+    # membership test - a missing branch anywhere is a KeyError.
     try:
-        return dic[keys[-1]]
+        for key in keys:
+            dic = dic[key]
     except KeyError:
         return 'bad_path'
 
+    return dic
+
 
 def generate_paths(dic):  # pragma: no cover
     """
@@ -564,19 +890,18 @@ def generate_paths(dic):  # pragma: no cover
     """
     paths = list()
 
-    def recurse(data, keys=()):
-        """
-        Do the actual recursion and yield the keys to generate_paths()
-        """
+    # explicit stack rather than nested generators. Children are pushed
+    # in reverse so they pop off in the same depth first order that
+    # the dict gives them.
+    stack = [(dic, ())]
+
+    while stack:
+        data, keys = stack.pop()
+
         if isinstance(data, dict):
-            for key in list(data.keys()):
-                for path in recurse(data[key], keys + (key,)):
-                    yield path
+            stack.extend((data[key], keys + (key,)) for key in reversed(list(data.keys())))
         else:
-            yield keys
-
-    for key in recurse(dic):
-        paths.append(key)
+            paths.append(keys)
 
     return paths
 
@@ -628,14 +953,20 @@ def is_nan(val):
     bool
         Is it NaN?
     """
+    # fast paths - NaN is the only float that is unequal to itself
+    # and the common non-float values never raise in the try below.
+    if isinstance(val, float):
+        return val != val  # pylint: disable=comparison-with-itself
+
+    if val is None or isinstance(val, six.integer_types):
+        return False
+
     try:
-        float(val)
-        if math.isnan(float(val)):
-            return True
+        fval = float(val)
     except (ValueError, TypeError):
-        pass
+        return False
 
-    return False
+    return fval != fval  # pylint: disable=comparison-with-itself
 
 
 def is_valid(val):
@@ -651,9 +982,27 @@ def is_valid(val):
     bool
         Is it valid?
     """
+    # numbers are the common case and never equal '', so only the
+    # float NaN check is needed for them.
+    if isinstance(val, float):
+        return val == val  # pylint: disable=comparison-with-itself
+
+    if isinstance(val, six.integer_types):
+        return True
+
     return not bool(val is None or val == '' or is_nan(val))
 
 
+# plain functions/lambdas, bound methods, C builtins and partials all
+# count as functions. Not callable() since that also matches classes.
+FUNCTION_TYPES = (
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+    functools.partial,
+)
+
+
 def is_function(func):
     """Test if a value is a function.
 
@@ -667,7 +1016,11 @@ def is_function(func):
     bool
         Is the object a python function?
     """
-    return isinstance(func, types.FunctionType)
+    return isinstance(func, FUNCTION_TYPES)
+
+
+# resolved on the first is_pipeline() call, see below.
+_PIPELINE_CLASS = None
 
 
 def is_pipeline(obj):
@@ -676,7 +1029,8 @@ def is_pipeline(obj):
     so the I/O don't need to import pipeline.py.
 
     This probably does not need to be deferred but doing it
-    for safety sake.
+    for safety sake. The class is only looked up once and then
+    kept in a module level reference.
 
     Parameters
     ----------
@@ -688,7 +1042,12 @@ def is_pipeline(obj):
     bool
         True if Pipeline
     """
-    from .pipeline import Pipeline
-    return isinstance(obj, Pipeline)
+    global _PIPELINE_CLASS  # pylint: disable=global-statement
+
+    if _PIPELINE_CLASS is None:
+        from .pipeline import Pipeline
+        _PIPELINE_CLASS = Pipeline
+
+    return isinstance(obj, _PIPELINE_CLASS)
 
 
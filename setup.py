@@ -7,12 +7,22 @@ Setup file for pypond distribution.
 import sys
 from setuptools import setup
 
-try:
-    # Use pandoc to convert .md -> .rst when uploading to pypi
-    import pypandoc
-    DESCRIPTION = pypandoc.convert('README.md', 'rst')
-except (IOError, ImportError, OSError):
-    DESCRIPTION = open('README.md').read()
+DESCRIPTION = None
+
+# Use pandoc to convert .md -> .rst when building a source distribution to
+# upload to pypi. pypandoc runs the pandoc binary several times, so other
+# commands (including the bdist_wheel that pip install runs) skip it and
+# use the markdown as is.
+if set(sys.argv) & set(['sdist', 'upload', 'register']):
+    try:
+        import pypandoc
+        DESCRIPTION = pypandoc.convert_file('README.md', 'rst')
+    except (AttributeError, IOError, ImportError, OSError):
+        pass
+
+if DESCRIPTION is None:
+    with open('README.md') as readme:
+        DESCRIPTION = readme.read()
 
 if sys.version_info[0] == 2 and sys.version_info[1] < 7:
     sys.exit('Sorry, Python 2 < 2.7 is not supported')
@@ -31,7 +41,11 @@ setup(
     packages=['pypond', 'pypond.processor', 'pypond.io'],
     scripts=[],
     install_requires=[
-        'pyrsistent==0.11.13',
+        # pyrsistent has prebuilt wheels from 0.18 on (python 3.6+ only),
+        # so the C extension does not get compiled on install. 0.16 is the
+        # last release series to support python 2 and python 3 < 3.6.
+        'pyrsistent>=0.11.13,<0.17; python_version < "3.6"',
+        'pyrsistent>=0.18.0; python_version >= "3.6"',
         'pytz>=2016.4',
         'tzlocal==1.2.2',
         'humanize==0.5.1',
@@ -52,6 +66,12 @@ setup(
         'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Programming Language :: JavaScript',
         'Topic :: Software Development :: Libraries',
     ],
@@ -2,7 +2,6 @@
 Tests for the align and rate processors.
 """
 
-import copy
 import unittest
 import warnings
 
@@ -230,97 +229,120 @@ class AlignTest(unittest.TestCase):
     tests for the align processor
     """
 
-    def setUp(self):
-        """setup for all tests."""
-        self._simple_ts = TimeSeries(SIMPLE_GAP_DATA)
+    @classmethod
+    def setUpClass(cls):
+        """setup for all tests - the series is immutable so build it once."""
+        cls._simple_ts = TimeSeries(SIMPLE_GAP_DATA)
+
+    def _assert_values(self, series, expected, field_path=None):
+        """check all of the values in a series in one pass over the events,
+        floats to 12 places and everything else (None, etc) exactly."""
+        values = series.values(field_path)
+
+        self.assertEqual(len(values), len(expected))
+
+        for val, exp in zip(values, expected):
+            if isinstance(exp, float):
+                self.assertAlmostEqual(val, exp, places=12)
+            else:
+                self.assertEqual(val, exp)
+
+    @staticmethod
+    def _processor_warnings(func):
+        """call func and return its result and any ProcessorWarnings it
+        issued - every ProcessorWarning is kept, other categories are
+        ignored rather than captured."""
+        with warnings.catch_warnings(record=True) as wrn:
+            warnings.simplefilter('ignore')
+            warnings.simplefilter('always', ProcessorWarning)
+            result = func()
+
+        return result, wrn
 
     def test_basic_linear_align(self):
         """test basic align"""
 
         aligned = self._simple_ts.align(window='1m')
 
-        self.assertEqual(aligned.size(), 8)
-        self.assertEqual(aligned.at(0).get(), 1.25)
-        self.assertEqual(aligned.at(1).get(), 1.8571428571428572)
-        self.assertEqual(aligned.at(2).get(), 1.2857142857142856)
-        self.assertEqual(aligned.at(3).get(), 1.0)
-        self.assertEqual(aligned.at(4).get(), 1.0)
-        self.assertEqual(aligned.at(5).get(), 1.0)
-        self.assertEqual(aligned.at(6).get(), 1.5)
-        self.assertEqual(aligned.at(7).get(), 2.5)
+        self._assert_values(aligned, [
+            1.25, 1.8571428571428572, 1.2857142857142856, 1.0, 1.0, 1.0, 1.5, 2.5,
+        ])
 
     def test_basic_hold_align(self):
         """test basic hold align."""
 
         aligned = self._simple_ts.align(window='1m', method='hold')
 
-        self.assertEqual(aligned.size(), 8)
-        self.assertEqual(aligned.at(0).get(), .75)
-        self.assertEqual(aligned.at(1).get(), 2)
-        self.assertEqual(aligned.at(2).get(), 2)
-        self.assertEqual(aligned.at(3).get(), 1)
-        self.assertEqual(aligned.at(4).get(), 1)
-        self.assertEqual(aligned.at(5).get(), 1)
-        self.assertEqual(aligned.at(6).get(), 1)
-        self.assertEqual(aligned.at(7).get(), 1)
+        self._assert_values(aligned, [.75, 2, 2, 1, 1, 1, 1, 1])
+
+        # boundaries filled from the same pair of events share a payload
+        self.assertIs(aligned.at(1).data(), aligned.at(2).data())
 
     def test_align_limit(self):
         """test basic hold align."""
 
         aligned = self._simple_ts.align(window='1m', method='hold', limit=2)
 
-        self.assertEqual(aligned.size(), 8)
-        self.assertEqual(aligned.at(0).get(), .75)
-        self.assertEqual(aligned.at(1).get(), 2)
-        self.assertEqual(aligned.at(2).get(), 2)
-        self.assertEqual(aligned.at(3).get(), None)  # over limit, fill with None
-        self.assertEqual(aligned.at(4).get(), None)  # over limit, fill with None
-        self.assertEqual(aligned.at(5).get(), None)  # over limit, fill with None
-        self.assertEqual(aligned.at(6).get(), 1)
-        self.assertEqual(aligned.at(7).get(), 1)
+        # over limit, fill with None
+        self._assert_values(aligned, [.75, 2, 2, None, None, None, 1, 1])
+
+        # all of the limit fills share the one None payload
+        self.assertIs(aligned.at(3).data(), aligned.at(5).data())
 
         aligned = self._simple_ts.align(field_spec='value', window='1m', method='linear', limit=2)
 
-        self.assertEqual(aligned.size(), 8)
-        self.assertEqual(aligned.at(0).get(), 1.25)
-        self.assertEqual(aligned.at(1).get(), 1.8571428571428572)
-        self.assertEqual(aligned.at(2).get(), 1.2857142857142856)
-        self.assertEqual(aligned.at(3).get(), None)  # over limit, fill with None
-        self.assertEqual(aligned.at(4).get(), None)  # over limit, fill with None
-        self.assertEqual(aligned.at(5).get(), None)  # over limit, fill with None
-        self.assertEqual(aligned.at(6).get(), 1.5)
-        self.assertEqual(aligned.at(7).get(), 2.5)
+        # over limit, fill with None
+        self._assert_values(aligned, [
+            1.25, 1.8571428571428572, 1.2857142857142856, None, None, None, 1.5, 2.5,
+        ])
 
     def test_invalid_point(self):
         """make sure non-numeric values are handled properly."""
 
-        bad_point = copy.deepcopy(SIMPLE_GAP_DATA)
+        # the points are flat lists, copying those is enough.
+        bad_point = dict(SIMPLE_GAP_DATA, points=[list(i) for i in SIMPLE_GAP_DATA.get('points')])
         bad_point.get('points')[-2][1] = 'non_numeric_value'
         ts = TimeSeries(bad_point)
 
-        with warnings.catch_warnings(record=True) as wrn:
-            aligned = ts.align(window='1m')
-            self.assertEqual(len(wrn), 1)
-            self.assertTrue(issubclass(wrn[0].category, ProcessorWarning))
-
-        self.assertEqual(aligned.size(), 8)
-        self.assertEqual(aligned.at(0).get(), 1.25)
-        self.assertEqual(aligned.at(1).get(), 1.8571428571428572)
-        self.assertEqual(aligned.at(2).get(), 1.2857142857142856)
-        self.assertEqual(aligned.at(3).get(), 1.0)
-        self.assertEqual(aligned.at(4).get(), 1.0)
-        self.assertEqual(aligned.at(5).get(), 1.0)
-        self.assertEqual(aligned.at(6).get(), None)  # bad value
-        self.assertEqual(aligned.at(7).get(), None)  # bad value
+        # one warning for the run of boundaries after the bad point,
+        # not one per boundary.
+        aligned, wrn = self._processor_warnings(lambda: ts.align(window='1m'))
+        self.assertEqual(len(wrn), 1)
+        self.assertTrue(issubclass(wrn[0].category, ProcessorWarning))
 
-        with warnings.catch_warnings(record=True) as wrn:
-            a_diff = aligned.rate()
-            self.assertEqual(len(wrn), 1)
-            self.assertTrue(issubclass(wrn[0].category, ProcessorWarning))
+        # last two are bad values
+        self._assert_values(aligned, [
+            1.25, 1.8571428571428572, 1.2857142857142856, 1.0, 1.0, 1.0, None, None,
+        ])
+
+        # rate warns once per bad pair and every one of them is counted
+        # now, not just the first one from that line.
+        a_diff, wrn = self._processor_warnings(aligned.rate)
+        self.assertEqual(len(wrn), 2)
+        self.assertTrue(all(issubclass(i.category, ProcessorWarning) for i in wrn))
 
         self.assertEqual(a_diff.at(5).get(), None)  # bad value
         self.assertEqual(a_diff.at(6).get(), None)  # bad value
 
+    def test_skip_uniform(self):
+        """an already aligned series can skip align when asked to."""
+
+        ts = TimeSeries(RATE)
+
+        skipped = ts.align(field_spec='in', window='30s', skip_uniform=True)
+        self.assertIs(skipped, ts)
+
+        # same values as actually running it
+        aligned = ts.align(field_spec='in', window='30s')
+        self._assert_values(aligned, skipped.values('in'), 'in')
+
+        # off by default, for hold and for data that is not uniform
+        self.assertIsNot(aligned, ts)
+        self.assertIsNot(
+            ts.align(field_spec='in', window='30s', method='hold', skip_uniform=True), ts)
+        self.assertIsNot(ts.align(field_spec='in', window='1m', skip_uniform=True), ts)
+        self.assertIsNot(self._simple_ts.align(window='1m', skip_uniform=True), self._simple_ts)
+
     def test_rate_mag(self):
         """test the rate processor order of mag."""
 
@@ -356,10 +378,9 @@ class AlignTest(unittest.TestCase):
         ts = TimeSeries(raw_rates)
         rates = ts.align(window='30s').rate()
 
-        self.assertEqual(rates.size(), 3)
-        self.assertEqual(rates.at(0).get('value_rate'), 1.0869565217391313)
-        self.assertEqual(rates.at(1).get('value_rate'), 1.0869565217391293)
-        self.assertEqual(rates.at(2).get('value_rate'), 1.0869565217391313)
+        self._assert_values(rates, [
+            1.0869565217391313, 1.0869565217391293, 1.0869565217391313,
+        ], 'value_rate')
 
     def test_rate_bins_long(self):
         """replicate counter to rate conversion with more data."""
@@ -394,17 +415,13 @@ class AlignTest(unittest.TestCase):
         rates = ts.align(window='30s').rate()
 
         # lower counter will produce negative derivatives
-        self.assertEqual(rates.size(), 3)
-        self.assertEqual(rates.at(0).get('value_rate'), -0.5434782608695656)
-        self.assertEqual(rates.at(1).get('value_rate'), -0.5434782608695646)
-        self.assertEqual(rates.at(2).get('value_rate'), -0.5434782608695653)
+        self._assert_values(rates, [
+            -0.5434782608695656, -0.5434782608695646, -0.5434782608695653,
+        ], 'value_rate')
 
         rates = ts.align(window='30s').rate(allow_negative=False)
 
-        self.assertEqual(rates.size(), 3)
-        self.assertEqual(rates.at(0).get('value_rate'), None)
-        self.assertEqual(rates.at(1).get('value_rate'), None)
-        self.assertEqual(rates.at(2).get('value_rate'), None)
+        self._assert_values(rates, [None, None, None], 'value_rate')
 
     def test_bad_args(self):
         """error states for coverage."""
@@ -175,11 +175,6 @@ class TestRenameFill(CleanBase):
         with self.assertRaises(ProcessorException):
             ts.fill(fill_limit='z')
 
-        # direct access to filler via pipeline needs to take a single path
-        with self.assertRaises(ProcessorException):
-            pip = Pipeline()
-            pip.fill(method='linear', field_spec=['direction.in', 'direction.out'])
-
         # invalid method
         with self.assertRaises(ProcessorException):
             pip = Pipeline()
@@ -389,11 +384,10 @@ class TestRenameFill(CleanBase):
 
         ts = TimeSeries(simple_missing_data)
 
-        # also test chaining multiple fillers together. in this series,
-        # field_spec=['direction.in', 'direction.out'] would not start
-        # filling until the 4th point so points 2 and 3 of direction.in
-        # would not be filled. A chain like this will ensure both
-        # columns will be fully filled.
+        # also test chaining multiple fillers together. this should
+        # produce the same results as a single filler with
+        # field_spec=['direction.in', 'direction.out'] since each
+        # column is filled independently.
 
         elist = (
             Pipeline()
@@ -419,6 +413,18 @@ class TestRenameFill(CleanBase):
         self.assertEqual(elist[4].get('direction.out'), 10.0)  # filled
         self.assertEqual(elist[5].get('direction.out'), 12)
 
+        single = (
+            Pipeline()
+            .from_source(ts)
+            .fill(field_spec=['direction.in', 'direction.out'], method='linear')
+            .to_event_list()
+        )
+
+        self.assertEqual(len(single), len(elist))
+
+        for i in enumerate(single):
+            self.assertTrue(Event.same(i[1], elist[i[0]]))
+
     def test_assymetric_linear_fill(self):
         """Test new chained/assymetric linear default fill in TimeSeries."""
 
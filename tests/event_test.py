@@ -16,7 +16,7 @@ import re
 import unittest
 
 # prefer freeze over the data type specific functions
-from pyrsistent import freeze, thaw
+from pyrsistent import freeze, pmap, thaw
 
 from pypond.event import Event
 from pypond.exceptions import EventException
@@ -584,6 +584,13 @@ class TestTimeRangeEvent(BaseTestEvent):
         tr4 = TimeRangeEvent(tr2._d)  # pylint: disable=protected-access
         self.assertEqual(tr4.to_json().get('data'), dict(value=2323))
         self.assertEqual(tr4.to_point()[1], 2323)
+        self.assertEqual(tr4, tr2)
+        self.assertNotEqual(tr4, tr1)
+
+        # a range/data pmap is still accepted
+        tr5 = TimeRangeEvent(pmap(dict(range=tr2.timerange(), data=tr2.data())))
+        self.assertEqual(tr5, tr2)
+        self.assertEqual(tr5.to_point()[1], 2323)
 
         # bad copy arg
         with self.assertRaises(EventException):
@@ -604,6 +611,56 @@ class TestTimeRangeEvent(BaseTestEvent):
 
         # bad merges
 
+    def test_from_key(self):
+        """from_key() is the inverse of key() for all the event types."""
+
+        t_range = TimeRange(self.test_begin_ts, self.test_end_ts)
+
+        for evt in (
+                Event(self.test_begin_ts, {'a': 1}),
+                IndexedEvent('1d-12355', {'a': 1}),
+                TimeRangeEvent(t_range, {'a': 1}),
+        ):
+            rebuilt = evt.type().from_key(evt.key(), {'a': 2})
+            self.assertEqual(rebuilt.type(), evt.type())
+            self.assertEqual(rebuilt.key(), evt.key())
+            self.assertEqual(rebuilt.get('a'), 2)
+
+    def test_slots(self):
+        """Events and their time ranges don't carry a per-instance __dict__."""
+
+        t_range = TimeRange(self.test_begin_ts, self.test_end_ts)
+
+        for obj in (
+                Event(self.test_begin_ts, {'a': 1}),
+                IndexedEvent('1d-12355', {'a': 1}),
+                TimeRangeEvent(t_range, {'a': 1}),
+                t_range,
+        ):
+            self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_to_point_variants(self):
+        """to_point_cols()/to_point_all() agree with to_point()."""
+
+        t_range = TimeRange(self.test_begin_ts, self.test_end_ts)
+        data = {'a': 1, 'b': {'c': 2}}
+
+        for evt in (
+                Event(self.test_begin_ts, data),
+                IndexedEvent('1d-12355', data),
+                TimeRangeEvent(t_range, data),
+        ):
+            self.assertEqual(evt.to_point_cols(['b', 'x', 'a']), evt.to_point(['b', 'x', 'a']))
+            self.assertEqual(evt.to_point_cols(['b', 'x', 'a'])[1:], [{'c': 2}, None, 1])
+            self.assertEqual(evt.to_point_all(), evt.to_point())
+            self.assertEqual(sorted(evt.to_point_all()[1:], key=str), [1, {'c': 2}])
+
+        events = [TimeRangeEvent(t_range, i) for i in range(3)]
+        self.assertEqual(TimeRangeEvent.bulk_to_points(events, ('value',)),
+                         [i.to_point(['value']) for i in events])
+        self.assertEqual(TimeRangeEvent.bulk_to_points(events),
+                         [i.to_point() for i in events])
+
     def test_ts_getters(self):
         """Test the accessors for the underlying TimeRange."""
         ctr = self.canned_time_range
@@ -621,6 +678,12 @@ class TestTimeRangeEvent(BaseTestEvent):
         self.assertEqual(self.canned_time_range.to_string(), json.dumps(jso))
         self.assertEqual(str(self.canned_time_range), json.dumps(jso))
 
+        # the cached timerange can't be mutated through the output
+        jso.get('timerange')[0] = 0
+        self.assertEqual(self.canned_time_range.to_point()[0][0], self.test_begin_ms)
+        self.assertEqual(self.canned_time_range.key(),
+                         '{0},{1}'.format(self.test_begin_ms, self.test_end_ms))
+
         self.assertEqual(self.canned_time_range.timerange_as_utc_string().find(
             self.test_begin_ts.strftime(HUMAN_FORMAT)), 1)
 
@@ -644,5 +707,18 @@ class TestTimeRangeEvent(BaseTestEvent):
         self.assertEqual(new_range.data(), dict(value=new_value))
         self.assertEqual(new_range.to_point()[1], new_value)
 
+        self.assertTrue(isinstance(new_range, TimeRangeEvent))
+        self.assertEqual(new_range.key(), ctr.key())
+
+        # several columns in one go
+        batched = ctr.set_data(dict(a=1, b=2)).batch_set(dict(b=3, c=dict(d=4)))
+        self.assertEqual(thaw(batched.data()), dict(a=1, b=3, c=dict(d=4)))
+        self.assertEqual(batched.get('c.d'), 4)
+        self.assertEqual(batched.timerange(), ctr.timerange())
+
+        # an immutable payload is shared rather than copied
+        payload = freeze(dict(value=33))
+        self.assertIs(ctr.set_data(payload).data(), payload)
+
 if __name__ == '__main__':
     unittest.main()
@@ -15,6 +15,7 @@ import time
 import unittest
 import warnings
 
+from pypond import index
 from pypond.index import Index
 from pypond.range import TimeRange
 from pypond.exceptions import IndexException, IndexWarning, UtilityWarning
@@ -203,6 +204,11 @@ class TestIndexStaticMethods(BaseTestIndex):
 
         self.assertEqual(Index.window_duration(self._year_index), None)
 
+        # cached results, including misses, come back the same
+        self.assertEqual(Index.window_duration(self._5_min_index), 300000)
+        self.assertEqual(Index.window_duration(self._year_index), None)
+        self.assertEqual(index._WINDOW_CACHE.get(self._5_min_index), 300000)  # pylint: disable=protected-access
+
     def test_get_index_string(self):
         """
         test get_index_string - datetime -> index
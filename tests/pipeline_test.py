@@ -674,6 +674,45 @@ class TestAggregator(BaseTestPipeline):
         self.assertEqual(RESULTS.get('1h-396200').get('in_avg'), 4.5)
         self.assertEqual(RESULTS.get('1h-396200').get('out_avg'), 8)
 
+    def test_each_event_window_cache(self):
+        """unchanged windows are not re-aggregated on each event."""
+
+        calls = list()
+
+        def counting_sum(values):
+            """sum that tracks how many times it is called."""
+            calls.append(len(values))
+            return sum(values)
+
+        def cback(event):
+            """callback to pass in."""
+            global RESULTS  # pylint: disable=global-statement
+            if RESULTS is None:
+                RESULTS = dict()
+            RESULTS['{0}'.format(event.index())] = event
+
+        uin = Stream()
+
+        (
+            Pipeline()
+            .from_source(uin)
+            .window_by('1m')
+            .emit_on('eachEvent')
+            .aggregate({'in_sum': {'in': counting_sum}})
+            .to(EventOut, cback)
+        )
+
+        # three one minute windows with two events each
+        for i in range(6):
+            uin.add_event(Event(1426316220000 + (i * 30000), {'in': i}))
+
+        # only the window the event landed in gets aggregated
+        self.assertEqual(calls, [1, 2, 1, 2, 1, 2])
+
+        self.assertEqual(RESULTS.get('1m-23771937').get('in_sum'), 1)
+        self.assertEqual(RESULTS.get('1m-23771938').get('in_sum'), 5)
+        self.assertEqual(RESULTS.get('1m-23771939').get('in_sum'), 9)
+
     def test_collect_and_aggregate(self):
         """collect events together and aggregate."""
         events_in = [
@@ -1294,6 +1333,20 @@ class TestOffsetPipeline(BaseTestPipeline):
         self.assertEqual(kcol['all'].at(2).get(), 29)
         self.assertEqual(kcol['all'].at(3).get(), 96)
 
+    def test_long_processor_chain(self):
+        """make sure chain() walks all the way back to the input."""
+        timeseries = TimeSeries(DATA)
+
+        pip = Pipeline().from_source(timeseries.collection())
+
+        for _ in range(5):
+            pip = pip.offset_by(1)
+
+        chain = pip.last().chain()
+
+        self.assertEqual(len(chain), 6)
+        self.assertTrue(chain[-1] is pip.input())
+
     def test_ts_offset_chain(self):
         """test running the offset chain directly from the TimeSeries."""
         timeseries = TimeSeries(DATA)
@@ -1437,5 +1490,37 @@ class TestOffsetPipeline(BaseTestPipeline):
 
         self.assertEqual(RESULTS.size(), 3)
 
+    def test_streaming_batch(self):
+        """add a batch of events to a stream."""
+
+        def cback(collection, window_key, group_by):  # pylint: disable=unused-argument
+            """callback to pass in."""
+            global RESULTS  # pylint: disable=global-statement
+            RESULTS = collection
+
+        source = Stream()
+
+        (
+            Pipeline()
+            .from_source(source)
+            .offset_by(3, 'in')
+            .to(CollectionOut, cback)
+        )
+
+        source.add_events(EVENTLIST1[:2])
+
+        # pylint: disable=no-member
+        self.assertEqual(RESULTS.size(), 2)
+        self.assertEqual(RESULTS.at(0).get('in'), EVENTLIST1[0].get('in') + 3)
+
+        # mixed types are rejected before anything is emitted
+        with self.assertRaises(PipelineIOException):
+            source.add_events([
+                EVENTLIST1[2],
+                IndexedEvent('1d-12355', {'value': 42}),
+            ])
+
+        self.assertEqual(RESULTS.size(), 2)
+
 if __name__ == '__main__':
     unittest.main()
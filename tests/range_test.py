@@ -197,6 +197,15 @@ class TestTimeRangeOutput(BaseTestTimeRange):
         self.assertEqual(rang.to_string(), '[{b}, {e}]'.format(b=self.test_begin_ms,
                                                                e=self.test_end_ms))
 
+        # the cached ms can't be changed through the output, for either
+        # the datetime or the ms constructors.
+        for trng in (rang, TimeRange(self.test_begin_ms, self.test_end_ms)):
+            trng.to_json()[0] = 0
+            self.assertEqual(trng.to_json(), [self.test_begin_ms, self.test_end_ms])
+            self.assertEqual(TimeRange(trng).to_json(), [self.test_begin_ms, self.test_end_ms])
+            self.assertEqual(trng.set_end(trng.begin()).to_json(),
+                             [self.test_begin_ms, self.test_begin_ms])
+
     def test_human_friendly_strings(self):
         """test human friendly outputs."""
 
@@ -12,6 +12,7 @@ Tests for the TimeSeries class
 Also including tests for Collection class since they are tightly bound.
 """
 
+import array
 import copy
 import datetime
 import json
@@ -509,6 +510,75 @@ class TestTimeSeries(SeriesBase):
         self.assertTrue(TimeSeries.equal(copy_ctor, ser1))
         self.assertFalse(copy_ctor is ser1)
 
+        # same size, different values - repeat to hit the cached fingerprints
+        ser3 = ser1.map(lambda e: e.set_data({'value': e.value() + 1}))
+        self.assertEqual(ser1.size(), ser3.size())
+        self.assertFalse(TimeSeries.same(ser1, ser3))
+        self.assertFalse(TimeSeries.same(ser1, ser3))
+        self.assertTrue(TimeSeries.same(ser1, ser2))
+
+    def test_to_columns(self):
+        """test the column oriented export."""
+
+        cols = TimeSeries(DATA).to_columns()
+
+        self.assertEqual(set(cols.keys()), set(['time', 'value', 'status']))
+        self.assertEqual(cols.get('time'), [i[0] for i in DATA.get('points')])
+        self.assertEqual(cols.get('value'), [52, 18, 26, 93])
+        self.assertEqual(cols.get('status'), ['ok', 'ok', 'fail', 'offline'])
+
+        empty = TimeSeries(dict(name='empty', columns=['time', 'value'], points=[]))
+        self.assertEqual(empty.to_columns(), dict())
+
+    def test_values(self):
+        """pull a single column out of the series."""
+
+        ts = TimeSeries(DATA)
+
+        self.assertEqual(ts.values(), [52, 18, 26, 93])
+        self.assertEqual(ts.values('status'), ['ok', 'ok', 'fail', 'offline'])
+        self.assertEqual(ts.values(['bogus']), [None] * 4)
+
+    def test_from_columns(self):
+        """build a series from column oriented data."""
+
+        cols = TimeSeries(DATA).to_columns()
+        ts1 = TimeSeries.from_columns('traffic', cols)
+
+        self.assertEqual(ts1.to_json(), TimeSeries(DATA).to_json())
+
+        # any sequence will do and the time column does not need to come first
+        ts2 = TimeSeries.from_columns(
+            'traffic', dict(value=array.array('d', [1, 2]), time=(1400425947000, 1400425948000)))
+
+        self.assertEqual(ts2.size(), 2)
+        self.assertEqual(ts2.at(1).get(), 2.0)
+        self.assertEqual(ts2.at(1).timestamp(), dt_from_ms(1400425948000))
+
+        # other event types round trip too, including processing results
+        # whose event type differs from the source series.
+        sept = TimeSeries(SEPT_2014_DATA)
+
+        for ts3 in (TimeSeries(TICKET_RANGE), TimeSeries(AVAILABILITY_DATA),
+                    sept.align(window='1h').rate(),
+                    sept.hourly_rollup(dict(value=dict(value=Functions.avg())))):
+            ts4 = TimeSeries.from_columns(ts3.name(), ts3.to_columns())
+            self.assertIs(ts4.collection().type(), ts3.collection().type())
+            # only the name is carried over, not the rest of the metadata
+            for key in ('columns', 'points'):
+                self.assertEqual(ts4.to_json().get(key), ts3.to_json().get(key))
+
+        self.assertEqual(TimeSeries.from_columns('empty', dict()).size(), 0)
+
+        with self.assertRaises(TimeSeriesException):
+            TimeSeries.from_columns('bad', dict(value=[1, 2]))
+
+        with self.assertRaises(TimeSeriesException):
+            TimeSeries.from_columns('bad', dict(time=[1, 2], index=['1d-1', '1d-2']))
+
+        with self.assertRaises(TimeSeriesException):
+            TimeSeries.from_columns('bad', dict(time=[1, 2], value=[1]))
+
     def test_merge_sum_and_map(self):
         """test the time series merging/map static methods."""
         t_in = TimeSeries(TRAFFIC_DATA_IN)
@@ -632,6 +702,28 @@ class TestRollups(SeriesBase):
     Tests for the rollup methods
     """
 
+    def test_wire_round_trip(self):
+        """the wire format header follows the event type of the result,
+        not of the source series."""
+
+        timeseries = TimeSeries(SEPT_2014_DATA)
+
+        rates = timeseries.align(window='1h').rate()
+        self.assertEqual(rates.to_json().get('columns')[0], 'timerange')
+
+        hourly = timeseries.hourly_rollup(dict(value=dict(value=Functions.avg())))
+        self.assertEqual(hourly.to_json().get('columns')[0], 'index')
+
+        for ser in (rates, hourly):
+            self.assertEqual(TimeSeries(ser.to_json()).to_json(), ser.to_json())
+
+        # an empty series picks up the header once it has events
+        empty = TimeSeries(dict(name='empty', events=list()))
+        self.assertEqual(empty.to_json().get('columns'), list())
+
+        filled = empty.set_collection(timeseries.collection())
+        self.assertEqual(filled.to_json().get('columns')[0], 'time')
+
     def test_fixed_window(self):
         """Test fixed window rollup"""
 
@@ -646,6 +738,28 @@ class TestRollups(SeriesBase):
         self.assertEqual(daily_avg.at(2).value(), 54.083333333333336)
         self.assertEqual(daily_avg.at(4).value(), 51.85)
 
+        # several aggregations sharing a single source column
+        daily = timeseries.fixed_window_rollup(
+            '1d',
+            dict(
+                value_avg=dict(value=Functions.avg()),
+                value_max=dict(value=Functions.max()),
+                value_min=dict(value=Functions.min()),
+            )
+        )
+
+        self.assertEqual(daily.at(0).get('value_avg'), 46.875)
+        self.assertTrue(daily.at(0).get('value_min') <= daily.at(0).get('value_avg'))
+        self.assertTrue(daily.at(0).get('value_max') >= daily.at(0).get('value_avg'))
+
+        # repeated rollups over the same window share the windowed prefix
+        daily_max = timeseries.fixed_window_rollup(
+            '1d',
+            dict(value=dict(value=Functions.max())))
+
+        self.assertEqual(daily_max.at(0).value(), daily.at(0).get('value_max'))
+        self.assertEqual(daily_avg.at(0).value(), 46.875)
+
         # not really a rollup, each data point will create one
         # aggregation index.
 
@@ -952,6 +1066,14 @@ class TestCollection(SeriesBase):
         self.assertEqual(col.median('out'), 4)
         self.assertEqual(col.stdev('out'), 1.632993161855452)
 
+    def test_values(self):
+        """Collection.values() pulls a single column."""
+
+        col = self._canned_collection
+        self.assertEqual(col.values('in'), [1, 3, 5])
+        self.assertEqual(col.values(['out']), [2, 4, 6])
+        self.assertEqual(col.values('bogus'), [None, None, None])
+
     def test_aggregation_filtering(self):
         """Test the new filtering methods for cleaning stuff."""
 
@@ -1016,6 +1138,28 @@ class TestCollection(SeriesBase):
         self.assertEqual(good_order.event_list_as_list(), EVENT_LIST)
         self.assertTrue(good_order.is_chronological())
 
+    def test_bisect(self):
+        """test Collection.bisect() on ordered and unordered events."""
+
+        events = [Event(i * 1000, {'value': i}) for i in (1, 2, 2, 4)]
+        col = Collection(events)
+
+        self.assertEqual(col.bisect(dt_from_ms(0)), 0)
+        self.assertEqual(col.bisect(dt_from_ms(2000)), 1)
+        self.assertEqual(col.bisect(dt_from_ms(2000), 2), 2)
+        self.assertEqual(col.bisect(dt_from_ms(3000)), 2)
+        self.assertEqual(col.bisect(dt_from_ms(5000)), 3)
+        self.assertEqual(col.bisect(dt_from_ms(1000), 3), 2)
+
+        # unordered collections fall back to a linear scan
+        unordered = Collection(list(reversed(events)))
+        self.assertFalse(unordered.is_chronological())
+        self.assertEqual(unordered.bisect(dt_from_ms(3000)), 0)
+        self.assertEqual(unordered.bisect(dt_from_ms(2000), 1), 1)
+
+        self.assertIsNone(Collection().bisect(dt_from_ms(0)))
+        self.assertTrue(Collection().is_chronological())
+
     def test_other_exceptions(self):
         """trigger other exceptions"""
         with self.assertRaises(PipelineIOException):
@@ -10,22 +10,46 @@
 Tests for the util module.
 """
 import datetime
+import decimal
+import functools
+import os
+import random
 import time
 import unittest
 
 import pytz
 
+from pypond import util
 from pypond.util import (
+    _format_human,
+    _get_local_tz,
+    _get_tzlocal_tz,
+    _to_local,
     aware_dt_from_args,
     aware_utcnow,
+    bulk_dt_from_ms,
+    bulk_ms_from_dt,
+    Capsule,
     dt_from_ms,
     dt_is_aware,
     EPOCH,
+    HUMAN_FORMAT,
+    humanize_dt,
+    is_function,
+    is_nan,
+    is_valid,
+    LOCAL_TZ,
     localtime_from_ms,
     localtime_info_from_utc,
     monthdelta,
     ms_from_dt,
+    nested_get,
+    nested_set,
+    Options,
     sanitize_dt,
+    to_milliseconds,
+    unique_id,
+    UTC,
 )
 from pypond.exceptions import UtilityException
 
@@ -61,6 +85,17 @@ class TestTime(unittest.TestCase):
         back_to_utc = dt_from_ms(utcms)
         self.assertEqual(utc, back_to_utc)
 
+    def test_to_milliseconds(self):
+        """truncating to ms agrees with an ms round trip."""
+        rnd = random.Random(42)
+
+        for _ in range(5000):
+            dtime = dt_from_ms(rnd.randint(-10 ** 12, 4 * 10 ** 12))
+            dtime = dtime.replace(microsecond=rnd.randint(0, 999999))
+            rounded = to_milliseconds(dtime)
+            self.assertEqual(rounded, dt_from_ms(ms_from_dt(dtime)))
+            self.assertEqual(rounded.microsecond % 1000, 0)
+
     def test_aware(self):
         """Verify test_aware function."""
         self.assertFalse(dt_is_aware(self.naive))
@@ -77,6 +112,21 @@ class TestTime(unittest.TestCase):
         dtime = dt_from_ms(self.ms_reference)
         self.assertTrue(dt_is_aware(dtime))
 
+        # bulk conversion
+        msecs = [self.ms_reference + i for i in (-1, 0, 1000)]
+        self.assertEqual(bulk_dt_from_ms(msecs), [dt_from_ms(i) for i in msecs])
+        self.assertEqual(bulk_dt_from_ms(iter(msecs)), [dt_from_ms(i) for i in msecs])
+        self.assertEqual(bulk_ms_from_dt(bulk_dt_from_ms(msecs)), msecs)
+
+        with self.assertRaises(UtilityException):
+            bulk_ms_from_dt([dtime, self.naive])
+
+        # repeat conversions come out of the cache
+        self.assertIs(dt_from_ms(self.ms_reference), dtime)
+        dt_from_ms.cache_clear()
+        self.assertIsNot(dt_from_ms(self.ms_reference), dtime)
+        self.assertEqual(dt_from_ms(self.ms_reference), dtime)
+
     def test_ms_from_dt(self):
         """Run reference ms into datetime and extract the ms again."""
         dtime = dt_from_ms(self.ms_reference)
@@ -84,10 +134,50 @@ class TestTime(unittest.TestCase):
         # after the round trip, value should be the same.
         self.assertEqual(new_ms, self.ms_reference)
 
+        # sub-ms precision is truncated and pre-epoch times work
+        self.assertEqual(ms_from_dt(dtime + datetime.timedelta(microseconds=999)),
+                         self.ms_reference)
+        self.assertEqual(ms_from_dt(dt_from_ms(-1500)), -1500)
+
         # test sanity check stopping naive datetime objects
         with self.assertRaises(UtilityException):
             ms_from_dt(self.naive)
 
+    def test_skip_dt_checks(self):
+        """ms_from_dt() can be told to trust its input."""
+        pacific = pytz.timezone('US/Pacific').localize(datetime.datetime(2016, 3, 23, 14, 23))
+
+        skip = util.SKIP_DT_CHECKS
+
+        util.SKIP_DT_CHECKS = False
+        try:
+            with self.assertRaises(UtilityException):
+                ms_from_dt(pacific)
+
+            util.SKIP_DT_CHECKS = True
+            self.assertEqual(ms_from_dt(pacific), ms_from_dt(sanitize_dt(pacific, testing=True)))
+        finally:
+            util.SKIP_DT_CHECKS = skip
+
+    def test_env_flag(self):
+        """only explicit true values turn an environment flag on."""
+        # pylint: disable=protected-access
+        name = 'PYPOND_TEST_FLAG'
+        saved = os.environ.pop(name, None)
+
+        try:
+            self.assertFalse(util._env_flag(name))
+
+            for val, expected in (('1', True), ('true', True), ('YES', True),
+                                  ('0', False), ('', False), ('false', False), ('no', False)):
+                os.environ[name] = val
+                self.assertEqual(util._env_flag(name), expected)
+        finally:
+            os.environ.pop(name, None)
+
+            if saved is not None:
+                os.environ[name] = saved
+
     def test_sanitize_dt(self):
         """Test datetime timezone conversion to UTC.
         """
@@ -98,6 +188,15 @@ class TestTime(unittest.TestCase):
         self.assertTrue(dt_is_aware(sanitized_utc))
         self.assertEqual(utc, sanitized_utc)
 
+        # already ms precision UTC comes back as is
+        self.assertIs(sanitize_dt(dt_from_ms(self.ms_reference)), dt_from_ms(self.ms_reference))
+
+        # pytz.UTC is still accepted and swapped for the canonical UTC
+        pytz_utc = utc.replace(tzinfo=pytz.UTC)
+        self.assertEqual(ms_from_dt(pytz_utc), ms_from_dt(utc))
+        self.assertIs(sanitize_dt(pytz_utc).tzinfo, UTC)
+        self.assertEqual(sanitize_dt(pytz_utc), utc)
+
         # Sanitize a time zone aware localtime to UTC. The
         # sanitized object
 
@@ -200,6 +299,172 @@ class TestTime(unittest.TestCase):
         # work logic in monthdelta
         dtime = datetime.datetime(year=2015, month=12, day=1)
         self.assertEqual(monthdelta(dtime, 0), dtime)
+        self.assertEqual(monthdelta(dtime, 1), datetime.datetime(2016, 1, 1))
+        self.assertEqual(monthdelta(dtime, -12), datetime.datetime(2014, 12, 1))
+
+        # clamp to the end of the month, leap years and century years
+        self.assertEqual(monthdelta(datetime.date(2000, 1, 31), 1), datetime.date(2000, 2, 29))
+        self.assertEqual(monthdelta(datetime.date(1900, 1, 31), 1), datetime.date(1900, 2, 28))
+        self.assertEqual(monthdelta(datetime.date(2016, 3, 31), -1), datetime.date(2016, 2, 29))
+
+    def test_options(self):
+        """attribute access goes through the data dict, no __dict__."""
+        opts = Options(foo='bar')
+        opts.baz = 1
+
+        self.assertEqual(opts.foo, 'bar')
+        self.assertEqual(opts.to_dict(), dict(foo='bar', baz=1))
+        self.assertIsNone(opts.missing)
+
+        for obj in (opts, Capsule()):
+            with self.assertRaises(AttributeError):
+                object.__getattribute__(obj, '__dict__')
+
+    def test_unique_id(self):
+        """ids are prefixed and never repeat."""
+        ids = [unique_id('test-') for _ in range(1000)]
+
+        self.assertEqual(len(set(ids)), 1000)
+        self.assertTrue(all(i.startswith('test-') for i in ids))
+
+    def test_nested_get(self):
+        """fetch nested values and flag missing branches."""
+        sample = dict()
+        nested_set(sample, ['bar', 'baz'], 23)
+        nested_set(sample, ['bar', 'none'], None)
+
+        self.assertEqual(nested_get(sample, ['bar', 'baz']), 23)
+        self.assertIsNone(nested_get(sample, ['bar', 'none']))
+        self.assertEqual(nested_get(sample, ['bar', 'quux']), 'bad_path')
+        self.assertEqual(nested_get(sample, ['foo', 'baz']), 'bad_path')
+        self.assertEqual(sample, dict(bar=dict(baz=23, none=None)))
+
+    def test_is_nan(self):
+        """NaN detection across the value types found in payloads."""
+        self.assertTrue(is_nan(float('NaN')))
+        self.assertTrue(is_nan('nan'))
+        self.assertTrue(is_nan(decimal.Decimal('NaN')))
+
+        for val in (None, 0, 1.5, True, 'bogus', '2.5', dict(), list()):
+            self.assertFalse(is_nan(val))
+
+    def test_is_valid(self):
+        """None, empty strings and NaN of any type are invalid."""
+        for val in (0, 0.0, 1.5, True, False, 'bogus', dict()):
+            self.assertTrue(is_valid(val))
+
+        for val in (None, '', float('NaN'), 'nan', decimal.Decimal('NaN')):
+            self.assertFalse(is_valid(val))
+
+    def test_is_function(self):
+        """functions, methods, builtins and partials but not classes."""
+        for func in (lambda x: x, monthdelta, max, 'abc'.upper,
+                     functools.partial(monthdelta, delta=1)):
+            self.assertTrue(is_function(func))
+
+        for val in (None, 1, 'max', dict, datetime.datetime):
+            self.assertFalse(is_function(val))
+
+    def test_humanize_dt(self):
+        """local time rendering, repeat calls come from the cache."""
+        dtime = dt_from_ms(self.ms_reference)
+        expected = dtime.astimezone(LOCAL_TZ).strftime(HUMAN_FORMAT)
+
+        self.assertEqual(humanize_dt(dtime), expected)
+        self.assertEqual(humanize_dt(dtime), expected)
+        local = _to_local(dtime)
+        self.assertEqual(local, dtime)
+        self.assertEqual(local.utcoffset(), dtime.astimezone(LOCAL_TZ).utcoffset())
+        self.assertIs(_to_local(dtime), local)
+
+        # same instant in another zone renders the same
+        self.assertEqual(humanize_dt(dtime.astimezone(pytz.timezone('US/Pacific'))), expected)
+
+    def test_format_human(self):
+        """_format_human() matches strftime(HUMAN_FORMAT)."""
+        for dtime in (
+                dt_from_ms(self.ms_reference),
+                dt_from_ms(0).astimezone(pytz.timezone('US/Pacific')),
+                # naive, no zone name. strftime pads years under 1000
+                # differently from platform to platform, so stay above.
+                datetime.datetime(1066, 1, 2, 3, 4, 5),
+        ):
+            self.assertEqual(_format_human(dtime), dtime.strftime(HUMAN_FORMAT))
+
+    def test_localtime_from_ms(self):
+        """integer ms take the per second path, floats the direct one."""
+        for msec in (0, 999, 1000, 1458768183949, -1500):
+            self.assertEqual(
+                localtime_from_ms(msec),
+                datetime.datetime.fromtimestamp(msec / 1000.0, LOCAL_TZ))
+
+        self.assertEqual(localtime_from_ms(1458768183949).microsecond, 949000)
+        self.assertEqual(localtime_from_ms(1500.0).microsecond, 500000)
+
+    def test_local_tz(self):
+        """LOCAL_TZ is the tzlocal zone, resolved once. The internals use
+        the same zone, possibly as a zoneinfo zone."""
+        self.assertIs(LOCAL_TZ, _get_tzlocal_tz())
+        self.assertIs(util.LOCAL_TZ, LOCAL_TZ)
+        self.assertIs(_get_local_tz(), _get_local_tz())
+        self.assertEqual(str(_get_local_tz()), str(LOCAL_TZ))
+
+        with self.assertRaises(AttributeError):
+            util.BOGUS  # pylint: disable=pointless-statement
+
+    def test_localtime_dst(self):
+        """the internal zone gives the same local times as the pytz zone
+        did on either side of a DST transition."""
+        # pylint: disable=protected-access
+        saved = util._LOCAL_TZ
+        pytz_zone = pytz.timezone('America/Los_Angeles')
+
+        try:
+            util._LOCAL_TZ = util.ZoneInfo('America/Los_Angeles') \
+                if util.ZoneInfo is not None else pytz_zone
+            util._LOCAL_SEC_CACHE.clear()
+
+            # 2016-03-13 10:00 UTC is 02:00 PST -> 03:00 PDT and
+            # 2016-11-06 09:00 UTC is 02:00 PDT -> 01:00 PST
+            for change in (1457863200000, 1478422800000):
+                for msec in range(change - 3600000, change + 3600001, 900000):
+                    new = localtime_from_ms(msec)
+                    old = datetime.datetime.fromtimestamp(msec / 1000.0, pytz_zone)
+
+                    self.assertEqual(new.replace(tzinfo=None), old.replace(tzinfo=None))
+                    self.assertEqual(new.utcoffset(), old.utcoffset())
+                    self.assertEqual(new.tzname(), old.tzname())
+        finally:
+            util._LOCAL_TZ = saved
+            util._LOCAL_SEC_CACHE.clear()
+
+    def test_localize_dst(self):
+        """wall times that are ambiguous or skipped at a DST transition
+        resolve to standard time like pytz localize() does."""
+        # pylint: disable=protected-access
+        saved = util._TZLOCAL_TZ
+
+        # tzlocal hands back either kind of zone depending on version
+        zones = [pytz.timezone('America/New_York')]
+
+        if util.ZoneInfo is not None:
+            zones.append(util.ZoneInfo('America/New_York'))
+
+        try:
+            for zone in zones:
+                util._TZLOCAL_TZ = zone
+
+                # 01:30 happens twice on 2021-11-07 and 02:30 never happens
+                # on 2021-03-14 - both get the EST offset.
+                for dtargs in (dict(year=2021, month=11, day=7, hour=1, minute=30),
+                               dict(year=2021, month=3, day=14, hour=2, minute=30)):
+                    dtime = aware_dt_from_args(dtargs, localize=True)
+
+                    self.assertEqual(dtime.utcoffset(), datetime.timedelta(hours=-5))
+                    self.assertEqual(
+                        dtime.replace(tzinfo=None), datetime.datetime(**dtargs))
+        finally:
+            util._TZLOCAL_TZ = saved
 
     def test_local_info(self):
         """test the code that extracts localized values from a UTC datetime."""